@@ -0,0 +1,65 @@
+import collections
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .modern_reader import new_configuration_from_json
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class ConfigCache:
+    """
+    Load configuration files, reusing the result if the file's modification
+    time and size haven't changed. Keeps up to ``maxsize`` files, dropping the
+    least recently used. The same object is returned for each hit, so don't
+    modify it.
+    """
+
+    def __init__(self, loader=new_configuration_from_json, maxsize=1024):
+        self.loader = loader
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, filename):
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        config = self.loader(path)
+
+        with self._lock:
+            self._entries[path] = (key, config)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return config
+
+    def load_many(self, filenames, *, max_workers=None):
+        """Load many files, parsing the ones that aren't cached in threads."""
+        with ThreadPoolExecutor(max_workers) as pool:
+            return list(pool.map(self.load, filenames))
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,86 @@
+import array
+import dataclasses
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .modern_reader import NewConfiguration
+
+# Typecode for the growing buffer of each field type; str uses a list
+TYPECODES = {int: "q", float: "d", bool: "B"}
+DTYPES = {int: np.int64, float: np.float64, bool: np.bool_}
+
+
+def check_type(value, field_type):
+    # bool is a subclass of int in Python, but not a valid size
+    if field_type is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if field_type is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, field_type)
+
+
+@dataclasses.dataclass
+class ConfigTable:
+    """Configurations stored as one typed NumPy array per field."""
+
+    columns: dict
+    cls: type = NewConfiguration
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def filter(self, mask):
+        """Select rows with a boolean array, such as ``table["size"] > 10``."""
+        return ConfigTable({k: v[mask] for k, v in self.columns.items()}, self.cls)
+
+    def row(self, index):
+        return self.cls(**{k: v[index].item() for k, v in self.columns.items()})
+
+
+def read_table(records, cls=NewConfiguration):
+    """
+    Build a ConfigTable from an iterable of dicts (one per configuration),
+    checking each value against the field types of the dataclass ``cls``.
+    Values go straight into typed buffers, so no per-row objects are kept.
+    """
+    fields = dataclasses.fields(cls)
+    buffers = {
+        f.name: array.array(TYPECODES[f.type]) if f.type in TYPECODES else []
+        for f in fields
+    }
+
+    for i, record in enumerate(records):
+        for f in fields:
+            value = record[f.name]
+            if not check_type(value, f.type):
+                msg = f"Record {i}: {f.name}={value!r} is not a {f.type.__name__}"
+                raise TypeError(msg)
+            buffers[f.name].append(value)
+
+    columns = {}
+    for f in fields:
+        if f.type in DTYPES:
+            columns[f.name] = np.frombuffer(buffers[f.name], dtype=DTYPES[f.type])
+        else:
+            columns[f.name] = np.array(buffers[f.name], dtype=str)
+    return ConfigTable(columns, cls)
+
+
+def iter_directory(directory, pattern="*.json"):
+    """Yield the contents of each JSON file in a directory, in sorted order."""
+    for filename in sorted(Path(directory).glob(pattern)):
+        with filename.open(encoding="utf-8") as f:
+            yield json.load(f)
+
+
+def iter_json_lines(filename):
+    """Yield each record of a JSON Lines file, skipping blank lines."""
+    with open(filename, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
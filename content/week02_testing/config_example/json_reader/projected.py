@@ -0,0 +1,116 @@
+import dataclasses
+import json
+import mmap
+import re
+
+from .modern_reader import NewConfiguration
+
+WHITESPACE = re.compile(rb"[ \t\n\r]*")
+STRING = re.compile(rb'"(?:[^"\\]|\\.)*+"', re.DOTALL)
+SCALAR = re.compile(rb"[^,}\]\s]*")
+
+
+def nested(levels):
+    # Anything inside a container, including containers nested up to
+    # ``levels`` deep, so that common values are skipped by one regex match
+    body = rb'(?:[^"\[\]{}]++|' + STRING.pattern + rb")*+"
+    for _ in range(levels):
+        body = (
+            rb'(?:[^"\[\]{}]++|'
+            + STRING.pattern
+            + rb"|\["
+            + body
+            + rb"\]|\{"
+            + body
+            + rb"\})*+"
+        )
+    return re.compile(body, re.DOTALL)
+
+
+NESTED = nested(4)
+
+
+def skip_whitespace(data, pos):
+    return WHITESPACE.match(data, pos).end()
+
+
+def expect(data, pos, char):
+    if data[pos : pos + 1] != char:
+        msg = f"Expected {char.decode()!r} at position {pos}"
+        raise ValueError(msg)
+    return pos + 1
+
+
+def skip_value(data, pos):
+    """Return the position just after the JSON value starting at ``pos``."""
+    start = data[pos : pos + 1]
+    if start == b'"':
+        return STRING.match(data, pos).end()
+    if start not in {b"[", b"{"}:
+        return SCALAR.match(data, pos).end()
+
+    # Deeper nesting than NESTED handles is tracked here
+    depth = 1
+    pos += 1
+    while True:
+        pos = NESTED.match(data, pos).end()
+        char = data[pos : pos + 1]
+        if char in {b"[", b"{"}:
+            depth += 1
+        elif char in {b"]", b"}"}:
+            depth -= 1
+        else:
+            msg = "Unterminated JSON value"
+            raise ValueError(msg)
+        pos += 1
+        if depth == 0:
+            return pos
+
+
+def read_projected(filename, keys):
+    """
+    Read only ``keys`` from the top-level object of a JSON file. Other values
+    are skipped over without building Python objects, and reading stops once
+    all the keys have been found.
+    """
+    keys = set(keys)
+    result = {}
+
+    with (
+        open(filename, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        pos = expect(data, skip_whitespace(data, 0), b"{")
+        while True:
+            pos = skip_whitespace(data, pos)
+            if data[pos : pos + 1] == b"}":
+                break
+
+            match = STRING.match(data, pos)
+            if match is None:
+                msg = f"Expected a key at position {pos}"
+                raise ValueError(msg)
+            key = json.loads(match.group())
+            pos = expect(data, skip_whitespace(data, match.end()), b":")
+            pos = skip_whitespace(data, pos)
+
+            end = skip_value(data, pos)
+            if key in keys:
+                result[key] = json.loads(data[pos:end])
+                if len(result) == len(keys):
+                    break
+
+            pos = skip_whitespace(data, end)
+            if data[pos : pos + 1] != b"}":
+                pos = expect(data, pos, b",")
+
+    return result
+
+
+def projected_configuration_from_json(filename, cls=NewConfiguration):
+    """Read a JSON file, parsing only the fields of the dataclass ``cls``."""
+
+    names = [f.name for f in dataclasses.fields(cls)]
+    json_dict = read_projected(filename, names)
+
+    return cls(**{name: json_dict[name] for name in names})
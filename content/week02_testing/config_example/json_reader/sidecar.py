@@ -0,0 +1,128 @@
+import dataclasses
+import functools
+import hashlib
+import os
+import struct
+from pathlib import Path
+
+from .modern_reader import NewConfiguration, new_configuration_from_json
+
+MAGIC = b"JRSC"
+VERSION = 1
+
+# Magic, format version, schema hash, then the JSON file's mtime (ns) and size
+HEADER = struct.Struct("<4sH8sqq")
+LENGTH = struct.Struct("<I")
+FORMATS = {
+    int: struct.Struct("<q"),
+    float: struct.Struct("<d"),
+    bool: struct.Struct("<?"),
+}
+
+
+def sidecar_path(filename):
+    filename = Path(filename)
+    return filename.with_name(filename.name + ".bin")
+
+
+@functools.cache
+def schema_hash(cls):
+    """A short hash of the field names and types, to detect schema changes."""
+    fields = dataclasses.fields(cls)
+    for f in fields:
+        if f.type not in FORMATS and f.type is not str:
+            msg = f"Field {f.name} has unsupported type {f.type!r}"
+            raise TypeError(msg)
+    text = ";".join(f"{f.name}:{f.type.__name__}" for f in fields)
+    return hashlib.blake2b(
+        f"{cls.__qualname__}({text})".encode(), digest_size=8
+    ).digest()
+
+
+def packable(config):
+    """
+    Values must have exactly the field's type, or they would come back as a
+    different type (such as ``10`` as ``10.0``) or not pack at all (``None``).
+    """
+    return all(
+        type(getattr(config, f.name)) is f.type for f in dataclasses.fields(config)
+    )
+
+
+def dump(config, stat):
+    cls = type(config)
+    parts = [
+        HEADER.pack(MAGIC, VERSION, schema_hash(cls), stat.st_mtime_ns, stat.st_size)
+    ]
+    for f in dataclasses.fields(cls):
+        value = getattr(config, f.name)
+        if f.type is str:
+            data = value.encode("utf-8")
+            parts += [LENGTH.pack(len(data)), data]
+        else:
+            parts.append(FORMATS[f.type].pack(value))
+    return b"".join(parts)
+
+
+def load(data, cls, stat):
+    """Decode a sidecar, or return None if it is stale or doesn't match."""
+    if len(data) < HEADER.size:
+        return None
+    magic, version, schema, mtime_ns, size = HEADER.unpack_from(data)
+    if (magic, version, schema) != (MAGIC, VERSION, schema_hash(cls)):
+        return None
+    if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+        return None
+
+    values = {}
+    pos = HEADER.size
+    try:
+        for f in dataclasses.fields(cls):
+            if f.type is str:
+                (length,) = LENGTH.unpack_from(data, pos)
+                pos += LENGTH.size
+                values[f.name] = data[pos : pos + length].decode("utf-8")
+                pos += length
+            else:
+                (values[f.name],) = FORMATS[f.type].unpack_from(data, pos)
+                pos += FORMATS[f.type].size
+    except (struct.error, UnicodeDecodeError):
+        return None
+    if pos != len(data):
+        return None
+
+    return cls(**values)
+
+
+def configuration_with_sidecar(
+    filename, cls=NewConfiguration, loader=new_configuration_from_json
+):
+    """
+    Load a configuration, using a binary sidecar file next to it when it
+    matches the JSON file and ``cls``. Otherwise, parse the JSON with
+    ``loader`` and (re)write the sidecar, unless a value doesn't have
+    exactly its field's type.
+    """
+    stat = os.stat(filename)
+    sidecar = sidecar_path(filename)
+
+    try:
+        config = load(sidecar.read_bytes(), cls, stat)
+    except OSError:
+        config = None
+    if config is not None:
+        return config
+
+    config = loader(filename)
+    if not packable(config):
+        return config
+
+    # Write to a temporary file first, so readers never see a partial file
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(dump(config, stat))
+        os.replace(tmp, sidecar)
+    except (OSError, struct.error):
+        tmp.unlink(missing_ok=True)
+
+    return config
@@ -0,0 +1,87 @@
+from json_reader import configuration_from_json, Configuration
+from json_reader.cache import ConfigCache
+from json_reader.modern_reader import NewConfiguration
+import dataclasses
+import json
+import os
+
+
+def write_config(filename, **changes):
+    config = NewConfiguration(
+        size=100,
+        name="Test",
+        simulation=True,
+        path="data/somewhere",
+        duration=10.0,
+    )
+    config = dataclasses.replace(config, **changes)
+    with filename.open("w") as f:
+        json.dump(dataclasses.asdict(config), f)
+    return config
+
+
+def test_cache_hit(tmp_path):
+    filename = tmp_path / "test.json"
+    config = write_config(filename)
+
+    cache = ConfigCache()
+    assert cache.load(filename) == config
+    assert cache.load(filename) is cache.load(filename)
+
+    info = cache.cache_info()
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_cache_modified(tmp_path):
+    filename = tmp_path / "test.json"
+    write_config(filename)
+
+    cache = ConfigCache()
+    cache.load(filename)
+
+    config = write_config(filename, name="Changed", size=12345)
+    stat = filename.stat()
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.load(filename) == config
+    assert cache.cache_info().misses == 2
+
+
+def test_cache_lru(tmp_path):
+    filenames = [tmp_path / f"test{i}.json" for i in range(3)]
+    for filename in filenames:
+        write_config(filename)
+
+    cache = ConfigCache(maxsize=2)
+    cache.load(filenames[0])
+    cache.load(filenames[1])
+    cache.load(filenames[0])
+    cache.load(filenames[2])  # Evicts filenames[1]
+
+    assert cache.cache_info().currsize == 2
+    cache.load(filenames[0])
+    assert cache.cache_info().hits == 2
+    cache.load(filenames[1])
+    assert cache.cache_info().misses == 4
+
+
+def test_load_many(tmp_path):
+    filenames = [tmp_path / f"test{i}.json" for i in range(20)]
+    configs = [write_config(f, size=i) for i, f in enumerate(filenames)]
+
+    cache = ConfigCache()
+    assert cache.load_many(filenames) == configs
+    assert cache.load_many(filenames) == configs
+    assert cache.cache_info().hits == 20
+
+
+def test_classic_loader(tmp_path):
+    filename = tmp_path / "test.json"
+    write_config(filename)
+
+    cache = ConfigCache(configuration_from_json)
+    config = cache.load(filename)
+    assert isinstance(config, Configuration)
+    assert config.size == 100
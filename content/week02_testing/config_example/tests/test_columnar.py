@@ -0,0 +1,74 @@
+from json_reader.columnar import (
+    read_table,
+    iter_directory,
+    iter_json_lines,
+)
+from json_reader.modern_reader import NewConfiguration
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+
+
+def make_config(i):
+    return NewConfiguration(
+        size=i,
+        name=f"run{i}",
+        simulation=i % 2 == 0,
+        path="data/somewhere",
+        duration=i / 2,
+    )
+
+
+def test_read_directory(tmp_path):
+    configs = [make_config(i) for i in range(10)]
+    for i, config in enumerate(configs):
+        with (tmp_path / f"config{i}.json").open("w") as f:
+            json.dump({**dataclasses.asdict(config), "extra": [1, 2, 3]}, f)
+
+    table = read_table(iter_directory(tmp_path))
+
+    assert len(table) == 10
+    assert table["size"].dtype == np.int64
+    assert table["duration"].dtype == np.float64
+    assert table["simulation"].dtype == np.bool_
+    rows = sorted((table.row(i) for i in range(10)), key=lambda c: c.size)
+    assert rows == configs
+
+
+def test_read_json_lines(tmp_path):
+    filename = tmp_path / "configs.jsonl"
+    with filename.open("w") as f:
+        for i in range(10):
+            f.write(json.dumps(dataclasses.asdict(make_config(i))) + "\n")
+
+    table = read_table(iter_json_lines(filename))
+
+    assert table.row(3) == make_config(3)
+    assert table["duration"].sum() == pytest.approx(22.5)
+
+    selected = table.filter(table["simulation"] & (table["size"] > 4))
+    assert list(selected["size"]) == [6, 8]
+    assert list(selected["name"]) == ["run6", "run8"]
+
+
+def test_read_empty():
+    table = read_table([])
+    assert len(table) == 0
+    assert table["size"].dtype == np.int64
+
+
+def test_read_bad_type():
+    record = dataclasses.asdict(make_config(1))
+    with pytest.raises(TypeError, match="size"):
+        read_table([{**record, "size": "big"}])
+    with pytest.raises(TypeError, match="simulation"):
+        read_table([{**record, "simulation": 1}])
+
+
+def test_read_missing_key():
+    record = dataclasses.asdict(make_config(1))
+    del record["name"]
+    with pytest.raises(KeyError):
+        read_table([record])
@@ -0,0 +1,53 @@
+from json_reader.modern_reader import NewConfiguration
+from json_reader.projected import projected_configuration_from_json, read_projected
+import dataclasses
+import json
+
+import pytest
+
+
+CONFIG = NewConfiguration(
+    size=100,
+    name="Test",
+    simulation=True,
+    path="data/somewhere",
+    duration=10.0,
+)
+
+
+def test_projected_config(tmp_path):
+    filename = tmp_path / "test.json"
+    payload = {
+        "mesh": [[i, {"a": '}]\\"', "b": [1.5, None]}] for i in range(1000)],
+        "table": {"x": "{[", "y": [[[[[[[]]]]]], {}]},
+    }
+    with filename.open("w") as f:
+        json.dump({"mesh": payload, **dataclasses.asdict(CONFIG), "z": 1}, f, indent=2)
+
+    assert projected_configuration_from_json(filename) == CONFIG
+
+
+def test_projected_keys(tmp_path):
+    filename = tmp_path / "test.json"
+    filename.write_text('{"a": 1, "b": "x\\"}", "c": [1, {"d": 2}], "e": false}')
+
+    assert read_projected(filename, ["c", "e"]) == {"c": [1, {"d": 2}], "e": False}
+    assert read_projected(filename, ["b", "missing"]) == {"b": 'x"}'}
+
+
+def test_projected_missing_key(tmp_path):
+    filename = tmp_path / "test.json"
+    config = dataclasses.asdict(CONFIG)
+    del config["name"]
+    filename.write_text(json.dumps(config))
+
+    with pytest.raises(KeyError):
+        projected_configuration_from_json(filename)
+
+
+def test_projected_invalid(tmp_path):
+    filename = tmp_path / "test.json"
+    filename.write_text("[1, 2]")
+
+    with pytest.raises(ValueError):
+        read_projected(filename, ["a"])
@@ -0,0 +1,96 @@
+from json_reader.modern_reader import NewConfiguration
+from json_reader.sidecar import configuration_with_sidecar, sidecar_path
+import dataclasses
+import json
+import os
+
+
+CONFIG = NewConfiguration(
+    size=100,
+    name="Tëst",
+    simulation=True,
+    path="data/somewhere",
+    duration=10.0,
+)
+
+
+def write_config(filename, config):
+    with filename.open("w") as f:
+        json.dump(dataclasses.asdict(config), f)
+
+
+def test_sidecar_written_and_used(tmp_path):
+    filename = tmp_path / "test.json"
+    write_config(filename, CONFIG)
+
+    assert configuration_with_sidecar(filename) == CONFIG
+    assert sidecar_path(filename).exists()
+
+    def fail(filename):
+        raise AssertionError("JSON should not be parsed")
+
+    assert configuration_with_sidecar(filename, loader=fail) == CONFIG
+
+
+def test_sidecar_json_changed(tmp_path):
+    filename = tmp_path / "test.json"
+    write_config(filename, CONFIG)
+    configuration_with_sidecar(filename)
+
+    changed = dataclasses.replace(CONFIG, size=12345)
+    write_config(filename, changed)
+    stat = filename.stat()
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert configuration_with_sidecar(filename) == changed
+
+
+def test_sidecar_schema_changed(tmp_path):
+    filename = tmp_path / "test.json"
+    write_config(filename, CONFIG)
+    configuration_with_sidecar(filename)
+
+    @dataclasses.dataclass
+    class NewConfiguration:
+        size: int
+        name: str
+
+    def loader(filename):
+        return NewConfiguration(size=1, name="other")
+
+    config = configuration_with_sidecar(filename, NewConfiguration, loader)
+    assert config == NewConfiguration(size=1, name="other")
+
+
+def test_sidecar_corrupt(tmp_path):
+    filename = tmp_path / "test.json"
+    write_config(filename, CONFIG)
+    configuration_with_sidecar(filename)
+
+    sidecar = sidecar_path(filename)
+    sidecar.write_bytes(sidecar.read_bytes()[:-3])
+
+    assert configuration_with_sidecar(filename) == CONFIG
+    assert configuration_with_sidecar(filename) == CONFIG
+
+
+def test_sidecar_not_written_for_none(tmp_path):
+    filename = tmp_path / "test.json"
+    config = dataclasses.replace(CONFIG, path=None)
+    write_config(filename, config)
+
+    assert configuration_with_sidecar(filename) == config
+    assert not sidecar_path(filename).exists()
+
+
+def test_sidecar_keeps_types(tmp_path):
+    filename = tmp_path / "test.json"
+    config = dataclasses.replace(CONFIG, duration=10, simulation=1)
+    write_config(filename, config)
+
+    first = configuration_with_sidecar(filename)
+    second = configuration_with_sidecar(filename)
+    assert not sidecar_path(filename).exists()
+    for loaded in (first, second):
+        assert type(loaded.duration) is int
+        assert type(loaded.simulation) is int
@@ -0,0 +1,29 @@
+import timeit
+import tracemalloc
+
+from vector import Vector
+from vector.frozen import FrozenVector
+
+N = 1_000_000
+
+
+def memory(cls):
+    tracemalloc.start()
+    vectors = [cls(i, i + 1) for i in range(N)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del vectors
+    return size / N
+
+
+def mag_throughput(cls, repeats=10):
+    vectors = [cls(i, i + 1) for i in range(N // 10)]
+    time = timeit.timeit(lambda: [v.mag() for v in vectors], number=repeats)
+    return repeats * len(vectors) / time
+
+
+for cls in (Vector, FrozenVector):
+    print(
+        f"{cls.__name__:>12}: {memory(cls):5.0f} bytes/vector,"
+        f" {mag_throughput(cls) / 1e6:5.1f}M mag()/s"
+    )
@@ -0,0 +1,60 @@
+from vector import Vector
+from vector.array import VectorArray
+
+import numpy as np
+import pytest
+
+
+def test_vector_array_ops():
+    v1 = VectorArray([1, 3], [2, 4])
+    v2 = VectorArray([3, 1], [4, 2])
+    assert (v1 + v2).to_vectors() == [Vector(4, 6), Vector(4, 6)]
+    assert (v1 - v2).to_vectors() == [Vector(-2, -2), Vector(2, 2)]
+    assert v1.mag() == pytest.approx([2.23606797749979, 5.0])
+
+
+def test_vector_array_broadcast():
+    v = VectorArray([1, 3], [2, 4])
+    assert (v + Vector(1, 1)).to_vectors() == [Vector(2, 3), Vector(4, 5)]
+    assert list(v == Vector(1, 2)) == [True, False]
+
+
+def test_vector_array_eq():
+    v1 = VectorArray([1, 2], [3, 4])
+    v2 = VectorArray([1, 2], [3, 5])
+    assert list(v1 == v2) == [True, False]
+
+
+def test_vector_array_roundtrip():
+    vectors = [Vector(1, 2), Vector(3, 4), Vector(5, 6)]
+    v = VectorArray.from_vectors(vectors)
+    assert v.data.dtype == np.float64
+    assert v.data.flags.c_contiguous
+    assert len(v) == 3
+    assert v.to_vectors() == vectors
+    assert list(v) == vectors
+
+
+def test_vector_array_view():
+    v = VectorArray([1, 3], [2, 4])
+    assert v[1] == Vector(3, 4)
+    assert v[-1] == Vector(3, 4)
+    assert v[1].mag() == pytest.approx(5.0)
+
+    v[0].x = 10
+    assert v.x[0] == 10
+
+    with pytest.raises(IndexError):
+        v[2]
+
+
+def test_vector_array_mask():
+    v = VectorArray([1, 3, 6], [2, 4, 8])
+    big = v[v.mag() > 4]
+    assert isinstance(big, VectorArray)
+    assert big.x.tolist() == [3, 6]
+    assert big.y.tolist() == [4, 8]
+
+    picked = v[np.array([2, 0])]
+    assert picked.x.tolist() == [6, 1]
+    assert v[np.int64(1)] == Vector(3, 4)
@@ -0,0 +1,36 @@
+from vector import Vector
+from vector.frozen import FrozenVector
+
+import pytest
+
+
+def test_frozen_ops():
+    v1 = FrozenVector(1, 2)
+    v2 = FrozenVector(3, 4)
+    assert v1 + v2 == FrozenVector(4, 6)
+    assert v1 - v2 == FrozenVector(-2, -2)
+    assert v1.mag() == pytest.approx(2.23606797749979)
+    assert v2.mag() == pytest.approx(5.0)
+    assert v2.mag() == pytest.approx(5.0)
+
+
+def test_frozen_repr():
+    v = FrozenVector(1, 2)
+    assert repr(v) == "FrozenVector(1, 2)"
+
+
+def test_frozen_eq_hash():
+    assert FrozenVector(1, 2) == Vector(1, 2)
+    assert FrozenVector(1, 2) == FrozenVector(1.0, 2.0)
+    assert len({FrozenVector(1, 2), FrozenVector(1.0, 2.0), FrozenVector(2, 1)}) == 2
+
+
+def test_frozen_immutable():
+    v = FrozenVector(1, 2)
+    with pytest.raises(AttributeError):
+        v.x = 3
+    with pytest.raises(AttributeError):
+        v.z = 3
+    with pytest.raises(AttributeError):
+        del v.y
+    assert not hasattr(v, "__dict__")
@@ -0,0 +1,97 @@
+import numpy as np
+
+from . import Vector
+
+
+class VectorView(Vector):
+    """A Vector that reads and writes one row of a VectorArray."""
+
+    def __init__(self, data, index):
+        self._data = data
+        self._index = index
+
+    @property
+    def x(self):
+        return self._data[self._index, 0]
+
+    @x.setter
+    def x(self, value):
+        self._data[self._index, 0] = value
+
+    @property
+    def y(self):
+        return self._data[self._index, 1]
+
+    @y.setter
+    def y(self, value):
+        self._data[self._index, 1] = value
+
+
+class VectorArray:
+    """Many 2D vectors, stored as one contiguous ``(n, 2)`` float64 array."""
+
+    def __init__(self, x, y):
+        self.data = np.empty((np.size(x), 2))
+        self.data[:, 0] = x
+        self.data[:, 1] = y
+
+    @classmethod
+    def from_data(cls, data):
+        self = cls.__new__(cls)
+        self.data = data
+        return self
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        return cls.from_data(
+            np.array([(v.x, v.y) for v in vectors], dtype=float).reshape(-1, 2)
+        )
+
+    def to_vectors(self):
+        return [Vector(x, y) for x, y in self.data.tolist()]
+
+    @property
+    def x(self):
+        return self.data[:, 0]
+
+    @property
+    def y(self):
+        return self.data[:, 1]
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        # Slices, masks, and index arrays select a VectorArray
+        if not isinstance(index, (int, np.integer)):
+            return self.from_data(self.data[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"index {index} out of range")
+        return VectorView(self.data, index)
+
+    def __iter__(self):
+        return (VectorView(self.data, i) for i in range(len(self)))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.x.tolist()}, {self.y.tolist()})"
+
+    def _other_data(self, other):
+        if isinstance(other, VectorArray):
+            return other.data
+        return np.array([other.x, other.y], dtype=float)
+
+    def __add__(self, other):
+        return self.from_data(self.data + self._other_data(other))
+
+    def __sub__(self, other):
+        return self.from_data(self.data - self._other_data(other))
+
+    def __eq__(self, other):
+        return np.all(self.data == self._other_data(other), axis=-1)
+
+    __hash__ = None
+
+    def mag(self):
+        return np.hypot(self.x, self.y)
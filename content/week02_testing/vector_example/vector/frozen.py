@@ -0,0 +1,40 @@
+class FrozenVector:
+    """
+    An immutable, hashable Vector. It uses ``__slots__`` instead of a
+    ``__dict__``, and computes its magnitude once, on first use.
+    """
+
+    __slots__ = ("x", "y", "_mag")
+
+    def __init__(self, x, y):
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.x}, {self.y})"
+
+    def __add__(self, other):
+        return FrozenVector(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return FrozenVector(self.x - other.x, self.y - other.y)
+
+    def __eq__(self, other):
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def mag(self):
+        try:
+            return self._mag
+        except AttributeError:
+            mag = (self.x**2 + self.y**2) ** 0.5
+            object.__setattr__(self, "_mag", mag)
+            return mag
@@ -0,0 +1,61 @@
+import contextlib
+import time
+
+import numpy as np
+
+from geometry.spatial import GridIndex, distance
+
+N = 1_000_000
+QUERIES = 1000  # The brute-force scans take a few minutes
+
+
+@contextlib.contextmanager
+def timer(name):
+    start = time.monotonic()
+    yield
+    print(f"{name}: took {time.monotonic() - start:.3}s to run")
+
+
+rng = np.random.default_rng(42)
+x, y = rng.uniform(0, 1000, size=(2, N))
+half_width = rng.uniform(0.05, 0.5, size=N)
+half_height = rng.uniform(0.05, 0.5, size=N)
+is_circle = rng.integers(2, size=N).astype(bool)
+half_height[is_circle] = half_width[is_circle]
+
+points = rng.uniform(0, 1000, size=(QUERIES, 2))
+
+with timer(f"Bulk load {N:,} shapes"):
+    index = GridIndex(x, y, half_width, half_height, is_circle)
+
+with timer(f"Grid index, {QUERIES:,} containment queries"):
+    found = [index.containing(px, py) for px, py in points]
+
+with timer(f"Brute force, {QUERIES:,} containment queries"):
+    expected = [
+        np.flatnonzero(distance(px, py, x, y, half_width, half_height, is_circle) == 0)
+        for px, py in points
+    ]
+
+assert all(np.array_equal(np.sort(a), b) for a, b in zip(found, expected))
+
+with timer(f"Grid index, {QUERIES:,} nearest queries"):
+    found = [index.nearest(px, py) for px, py in points]
+
+with timer(f"Brute force, {QUERIES:,} nearest queries"):
+    expected = [
+        np.argmin(distance(px, py, x, y, half_width, half_height, is_circle))
+        for px, py in points
+    ]
+
+# Ties can pick different shapes, so compare how close they are
+for (px, py), i, j in zip(points, found, expected):
+    pair = [i, j]
+    d = distance(
+        px, py, x[pair], y[pair], half_width[pair], half_height[pair], is_circle[pair]
+    )
+    assert d[0] == d[1]
+
+with timer(f"Grid index, {QUERIES:,} bounding box queries"):
+    for px, py in points:
+        index.intersecting(px, py, px + 5, py + 5)
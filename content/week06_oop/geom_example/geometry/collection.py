@@ -0,0 +1,105 @@
+import dataclasses
+import math
+
+import numpy as np
+
+from .classic import Circle, Rectagle, Square, Triangle
+
+
+KINDS = ("triangles", "rectangles", "squares", "circles")
+
+
+def _empty(*shape):
+    return dataclasses.field(default_factory=lambda: np.empty((0, *shape)))
+
+
+@dataclasses.dataclass
+class ShapeCollection:
+    """
+    Many shapes, stored as one NumPy array per kind of shape (structure of
+    arrays), so that areas and perimeters are computed without a Python call
+    per shape. ``kinds`` holds the index into ``KINDS`` of each shape, in
+    the original order; it defaults to all triangles, then rectangles, etc.
+    """
+
+    triangles: np.ndarray = _empty(3)  # Side lengths a, b, c
+    rectangles: np.ndarray = _empty(2)  # Width, height
+    squares: np.ndarray = _empty()  # Side
+    circles: np.ndarray = _empty()  # Radius
+    kinds: np.ndarray | None = None  # Kind of each shape, in order
+
+    def __post_init__(self):
+        self.triangles = np.asarray(self.triangles, dtype=float).reshape(-1, 3)
+        self.rectangles = np.asarray(self.rectangles, dtype=float).reshape(-1, 2)
+        self.squares = np.asarray(self.squares, dtype=float).reshape(-1)
+        self.circles = np.asarray(self.circles, dtype=float).reshape(-1)
+        assert np.all(self.circles >= 0), "Radius must be non-negative"
+
+        counts = [len(getattr(self, kind)) for kind in KINDS]
+        if self.kinds is None:
+            self.kinds = np.repeat(np.arange(len(KINDS)), counts)
+        self.kinds = np.asarray(self.kinds, dtype=np.int8).reshape(-1)
+        assert np.array_equal(np.bincount(self.kinds, minlength=len(KINDS)), counts), (
+            "kinds must match the number of each shape"
+        )
+
+    @classmethod
+    def from_shapes(cls, shapes):
+        triangles, rectangles, squares, circles = [], [], [], []
+        kinds = []
+        for shape in shapes:
+            # Square is a Rectagle, so exact types are needed here
+            if type(shape) is Triangle:
+                triangles.append((shape.a, shape.b, shape.c))
+                kinds.append(0)
+            elif type(shape) is Rectagle:
+                rectangles.append((shape.width, shape.height))
+                kinds.append(1)
+            elif type(shape) is Square:
+                squares.append(shape.width)
+                kinds.append(2)
+            elif type(shape) is Circle:
+                circles.append(shape.radius)
+                kinds.append(3)
+            else:
+                raise TypeError(f"Unsupported shape: {shape!r}")
+        return cls(triangles, rectangles, squares, circles, kinds)
+
+    def to_shapes(self):
+        """Return the shapes as a list of objects, in their original order."""
+        grouped = [
+            iter([Triangle(a, b, c) for a, b, c in self.triangles.tolist()]),
+            iter([Rectagle(w, h) for w, h in self.rectangles.tolist()]),
+            iter([Square(s) for s in self.squares.tolist()]),
+            iter([Circle(r) for r in self.circles.tolist()]),
+        ]
+        return [next(grouped[kind]) for kind in self.kinds.tolist()]
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def area(self):
+        """Area of each shape, as a dict of arrays keyed by kind."""
+        a, b, c = self.triangles.T
+        s = (a + b + c) / 2
+        return {
+            "triangles": np.sqrt(s * (s - a) * (s - b) * (s - c)),
+            "rectangles": self.rectangles[:, 0] * self.rectangles[:, 1],
+            "squares": self.squares**2,
+            "circles": math.pi * self.circles**2,
+        }
+
+    def perimeter(self):
+        """Perimeter of each shape, as a dict of arrays keyed by kind."""
+        return {
+            "triangles": self.triangles.sum(axis=1),
+            "rectangles": 2 * self.rectangles.sum(axis=1),
+            "squares": 4 * self.squares,
+            "circles": math.tau * self.circles,
+        }
+
+    def total_area(self):
+        return sum(area.sum() for area in self.area().values())
+
+    def total_perimeter(self):
+        return sum(perimeter.sum() for perimeter in self.perimeter().values())
@@ -0,0 +1,192 @@
+import dataclasses
+import math
+
+import numpy as np
+
+from .classic import Circle, Rectagle, Shape
+
+
+@dataclasses.dataclass
+class Positioned:
+    """A Circle or Rectagle (including Square) centered at ``(x, y)``."""
+
+    shape: Shape
+    x: float
+    y: float
+
+    def __post_init__(self):
+        if not isinstance(self.shape, (Circle, Rectagle)):
+            raise TypeError(f"Unsupported shape: {self.shape!r}")
+
+    def bounds(self):
+        if isinstance(self.shape, Circle):
+            half_width = half_height = self.shape.radius
+        else:
+            half_width = self.shape.width / 2
+            half_height = self.shape.height / 2
+        return (
+            self.x - half_width,
+            self.y - half_height,
+            self.x + half_width,
+            self.y + half_height,
+        )
+
+    def contains(self, x, y):
+        if isinstance(self.shape, Circle):
+            return (x - self.x) ** 2 + (y - self.y) ** 2 <= self.shape.radius**2
+        xmin, ymin, xmax, ymax = self.bounds()
+        return xmin <= x <= xmax and ymin <= y <= ymax
+
+
+def distance(x, y, center_x, center_y, half_width, half_height, is_circle):
+    """Distance from a point to each shape, zero if the point is inside."""
+    dx = np.abs(x - center_x)
+    dy = np.abs(y - center_y)
+    box = np.hypot(np.maximum(dx - half_width, 0), np.maximum(dy - half_height, 0))
+    circle = np.maximum(np.hypot(dx, dy) - half_width, 0)
+    return np.where(is_circle, circle, box)
+
+
+class GridIndex:
+    """
+    A uniform grid over positioned shapes. Each cell stores the shapes whose
+    bounding box overlaps it, so queries only look at shapes in nearby cells.
+    Results are indices into the shapes the index was built from.
+    """
+
+    def __init__(self, x, y, half_width, half_height, is_circle, *, cell_size=None):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.half_width = np.asarray(half_width, dtype=float)
+        self.half_height = np.asarray(half_height, dtype=float)
+        self.is_circle = np.asarray(is_circle, dtype=bool)
+
+        xmin = self.x - self.half_width
+        ymin = self.y - self.half_height
+        xmax = self.x + self.half_width
+        ymax = self.y + self.half_height
+
+        self.origin = (xmin.min(), ymin.min())
+        if cell_size is None:
+            # Roughly one shape per cell, but not much smaller than a shape
+            extent = (xmax.max() - self.origin[0]) * (ymax.max() - self.origin[1])
+            typical = 2 * np.mean(np.maximum(self.half_width, self.half_height))
+            cell_size = max(math.sqrt(extent / len(self.x)), typical)
+        self.cell_size = cell_size
+
+        ix0, iy0 = self._cell(xmin, ymin)
+        ix1, iy1 = self._cell(xmax, ymax)
+        self.shape = (int(iy1.max()) + 1, int(ix1.max()) + 1)
+
+        # Bulk load: one entry for each (shape, cell) pair, sorted by cell
+        nx = ix1 - ix0 + 1
+        counts = nx * (iy1 - iy0 + 1)
+        ids = np.repeat(np.arange(len(self.x)), counts)
+        local = np.arange(len(ids)) - np.repeat(np.cumsum(counts) - counts, counts)
+        cells = (
+            (iy0[ids] + local // nx[ids]) * self.shape[1] + ix0[ids] + local % nx[ids]
+        )
+
+        order = np.argsort(cells, kind="stable")
+        self.items = ids[order]
+        self.offsets = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=np.intp)
+        np.cumsum(
+            np.bincount(cells, minlength=len(self.offsets) - 1), out=self.offsets[1:]
+        )
+
+    @classmethod
+    def from_shapes(cls, positioned, *, cell_size=None):
+        values = []
+        for item in positioned:
+            xmin, ymin, xmax, ymax = item.bounds()
+            is_circle = isinstance(item.shape, Circle)
+            values.append((item.x, item.y, xmax - item.x, ymax - item.y, is_circle))
+        x, y, half_width, half_height, is_circle = np.array(values).reshape(-1, 5).T
+        return cls(x, y, half_width, half_height, is_circle, cell_size=cell_size)
+
+    def __len__(self):
+        return len(self.x)
+
+    def _cell(self, x, y):
+        ix = np.floor((x - self.origin[0]) / self.cell_size).astype(np.intp)
+        iy = np.floor((y - self.origin[1]) / self.cell_size).astype(np.intp)
+        return ix, iy
+
+    def _candidates(self, ix0, iy0, ix1, iy1):
+        ix0, iy0 = max(ix0, 0), max(iy0, 0)
+        ix1, iy1 = min(ix1, self.shape[1] - 1), min(iy1, self.shape[0] - 1)
+        if ix0 > ix1 or iy0 > iy1:
+            return np.empty(0, dtype=np.intp)
+        rows = [
+            self.items[self.offsets[row + ix0] : self.offsets[row + ix1 + 1]]
+            for row in range(
+                iy0 * self.shape[1], (iy1 + 1) * self.shape[1], self.shape[1]
+            )
+        ]
+        return np.unique(np.concatenate(rows))
+
+    def _distance(self, x, y, ids):
+        return distance(
+            x,
+            y,
+            self.x[ids],
+            self.y[ids],
+            self.half_width[ids],
+            self.half_height[ids],
+            self.is_circle[ids],
+        )
+
+    def containing(self, x, y):
+        """Indices of the shapes that contain the point ``(x, y)``."""
+        ix, iy = self._cell(x, y)
+        ids = self._candidates(ix, iy, ix, iy)
+        return ids[self._distance(x, y, ids) == 0]
+
+    def intersecting(self, xmin, ymin, xmax, ymax):
+        """Indices of the shapes whose bounding box overlaps the given box."""
+        ix0, iy0 = self._cell(xmin, ymin)
+        ix1, iy1 = self._cell(xmax, ymax)
+        ids = self._candidates(ix0, iy0, ix1, iy1)
+        keep = (
+            (self.x[ids] - self.half_width[ids] <= xmax)
+            & (self.x[ids] + self.half_width[ids] >= xmin)
+            & (self.y[ids] - self.half_height[ids] <= ymax)
+            & (self.y[ids] + self.half_height[ids] >= ymin)
+        )
+        return ids[keep]
+
+    def nearest(self, x, y):
+        """
+        Index of the shape closest to ``(x, y)`` (distance zero if inside).
+        Rings of cells are searched outward until no unseen shape could be
+        closer; this is fast for points inside the grid.
+        """
+        ix, iy = self._cell(x, y)
+        ix = min(max(ix, 0), self.shape[1] - 1)
+        iy = min(max(iy, 0), self.shape[0] - 1)
+        best, best_distance = -1, math.inf
+        ring = 0
+        while True:
+            ids = self._candidates(ix - ring, iy - ring, ix + ring, iy + ring)
+            if len(ids):
+                distances = self._distance(x, y, ids)
+                i = np.argmin(distances)
+                if distances[i] < best_distance:
+                    best, best_distance = ids[i], distances[i]
+
+            # Shapes not seen yet are at least this far away
+            margin = min(
+                x - (self.origin[0] + (ix - ring) * self.cell_size),
+                self.origin[0] + (ix + ring + 1) * self.cell_size - x,
+                y - (self.origin[1] + (iy - ring) * self.cell_size),
+                self.origin[1] + (iy + ring + 1) * self.cell_size - y,
+            )
+            covered = (
+                ix - ring <= 0
+                and iy - ring <= 0
+                and ix + ring >= self.shape[1] - 1
+                and iy + ring >= self.shape[0] - 1
+            )
+            if best_distance <= margin or covered:
+                return int(best)
+            ring += 1
@@ -0,0 +1,49 @@
+from geometry.classic import Rectagle, Square, Circle, Triangle
+from geometry.collection import ShapeCollection
+import math
+from pytest import approx
+import pytest
+
+
+def test_collection_roundtrip():
+    shapes = [Circle(2), Triangle(3, 4, 5), Square(4), Rectagle(3, 4), Circle(1)]
+    collection = ShapeCollection.from_shapes(shapes)
+
+    assert len(collection) == 5
+    assert collection.to_shapes() == shapes
+    assert type(collection.to_shapes()[2]) is Square
+    assert type(collection.to_shapes()[3]) is Rectagle
+
+
+def test_collection_area_perimeter():
+    shapes = [Triangle(3, 4, 5), Rectagle(3, 4), Square(4), Circle(2), Circle(1)]
+    collection = ShapeCollection.from_shapes(shapes)
+
+    area = collection.area()
+    assert area["triangles"] == approx([6])
+    assert area["rectangles"] == approx([12])
+    assert area["squares"] == approx([16])
+    assert area["circles"] == approx([math.pi * 4, math.pi])
+
+    perimeter = collection.perimeter()
+    assert perimeter["triangles"] == approx([12])
+    assert perimeter["rectangles"] == approx([14])
+    assert perimeter["squares"] == approx([16])
+    assert perimeter["circles"] == approx([math.pi * 4, math.pi * 2])
+
+    assert collection.total_area() == approx(sum(s.area() for s in shapes))
+    assert collection.total_perimeter() == approx(sum(s.perimeter() for s in shapes))
+
+
+def test_collection_empty():
+    collection = ShapeCollection(circles=[1, 2])
+
+    assert len(collection) == 2
+    assert collection.area()["triangles"].shape == (0,)
+    assert collection.total_area() == approx(5 * math.pi)
+    assert collection.to_shapes() == [Circle(1), Circle(2)]
+
+
+def test_collection_unsupported():
+    with pytest.raises(TypeError):
+        ShapeCollection.from_shapes([object()])
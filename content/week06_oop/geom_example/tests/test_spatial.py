@@ -0,0 +1,73 @@
+from geometry.classic import Rectagle, Square, Circle, Triangle
+from geometry.spatial import GridIndex, Positioned
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def shapes():
+    rng = np.random.default_rng(42)
+    shapes = []
+    for x, y, size in rng.uniform([0, 0, 0.1], [100, 100, 3], size=(500, 3)):
+        kind = rng.integers(3)
+        if kind == 0:
+            shape = Circle(size)
+        elif kind == 1:
+            shape = Rectagle(size, size / 2)
+        else:
+            shape = Square(size)
+        shapes.append(Positioned(shape, x, y))
+    return shapes
+
+
+def test_positioned():
+    circle = Positioned(Circle(1), 2, 3)
+    assert circle.bounds() == (1, 2, 3, 4)
+    assert circle.contains(2.5, 3.5)
+    assert not circle.contains(2.9, 3.9)
+
+    rectangle = Positioned(Rectagle(2, 4), 0, 0)
+    assert rectangle.bounds() == (-1, -2, 1, 2)
+    assert rectangle.contains(0.9, 1.9)
+    assert not rectangle.contains(1.1, 0)
+
+    with pytest.raises(TypeError):
+        Positioned(Triangle(3, 4, 5), 0, 0)
+
+
+def test_containing(shapes):
+    index = GridIndex.from_shapes(shapes)
+    for x, y in np.random.default_rng(1).uniform(-5, 105, size=(200, 2)):
+        expected = [i for i, s in enumerate(shapes) if s.contains(x, y)]
+        assert sorted(index.containing(x, y)) == expected
+
+
+def test_intersecting(shapes):
+    index = GridIndex.from_shapes(shapes, cell_size=5)
+    box = (10, 20, 30, 25)
+    expected = []
+    for i, s in enumerate(shapes):
+        xmin, ymin, xmax, ymax = s.bounds()
+        if xmin <= box[2] and xmax >= box[0] and ymin <= box[3] and ymax >= box[1]:
+            expected.append(i)
+    assert sorted(index.intersecting(*box)) == expected
+
+
+def test_nearest(shapes):
+    index = GridIndex.from_shapes(shapes)
+    x = np.array([s.x for s in shapes])
+    y = np.array([s.y for s in shapes])
+    half_width = np.array([s.bounds()[2] - s.x for s in shapes])
+    half_height = np.array([s.bounds()[3] - s.y for s in shapes])
+    is_circle = np.array([isinstance(s.shape, Circle) for s in shapes])
+
+    for px, py in np.random.default_rng(2).uniform(-20, 120, size=(200, 2)):
+        i = index.nearest(px, py)
+        distances = np.hypot(
+            np.maximum(np.abs(px - x) - half_width, 0),
+            np.maximum(np.abs(py - y) - half_height, 0),
+        )
+        distances = np.where(
+            is_circle, np.maximum(np.hypot(px - x, py - y) - half_width, 0), distances
+        )
+        assert distances[i] == pytest.approx(distances.min())
@@ -0,0 +1,35 @@
+import contextlib
+import time
+
+import numba
+import numpy as np
+
+from integrator import RK4Integrator
+from integrator.jit import JitRK4Integrator
+
+
+@contextlib.contextmanager
+def timer(name):
+    start = time.monotonic()
+    yield
+    print(f"{name}: took {time.monotonic() - start:.3}s to run")
+
+
+@numba.njit
+def f(t, y):
+    "Y has two elements, x and v"
+    return np.array([-1 * y[1], y[0]])
+
+
+ts = np.linspace(0, 40, 100_000 + 1)
+
+# Compile once before timing
+JitRK4Integrator().integrate(f, ts[:2], [1, 0])
+
+with timer("Python RK4"):
+    y_python = RK4Integrator().integrate(f.py_func, ts, [1, 0])
+
+with timer("Numba RK4"):
+    y_jit = JitRK4Integrator().integrate(f, ts, [1, 0])
+
+print(f"Max difference: {np.max(np.abs(y_python - y_jit))}")
@@ -16,9 +16,10 @@ class IntegratorBase(abc.ABC):
 
     def integrate(self, f, t, init_y):
         steps = len(t)
-        order = len(init_y)  # Number of equations
+        # Either (order,) for one trajectory, or (n_traj, order) for an ensemble
+        shape = np.shape(init_y)
 
-        y = np.empty((steps, order))
+        y = np.empty((steps, *shape))
         y[0] = init_y  # Note that this sets the elements of the first row
 
         for n in range(steps - 1):
@@ -0,0 +1,82 @@
+import numba
+import numpy as np
+from numba.extending import is_jitted
+
+from . import EulerIntegrator, RK4Integrator
+
+
+__all__ = ["JitEulerIntegrator", "JitRK4Integrator"]
+
+
+def __dir__():
+    return __all__
+
+
+# These loops mirror compute_step in the pure Python integrators, but run the
+# whole time loop in compiled code, reusing a single buffer for stage inputs.
+
+
+@numba.njit
+def euler_loop(f, t, y):
+    order = y.shape[1]
+    for n in range(len(t) - 1):
+        h = t[n + 1] - t[n]
+        dydt = f(t[n], y[n])
+        for j in range(order):
+            y[n + 1, j] = y[n, j] - dydt[j] * h
+
+
+@numba.njit
+def rk4_loop(f, t, y):
+    order = y.shape[1]
+    tmp = np.empty(order)
+    for n in range(len(t) - 1):
+        t_n = t[n]
+        h = t[n + 1] - t_n
+        y_n = y[n]
+
+        k1 = f(t_n, y_n)
+        for j in range(order):
+            tmp[j] = y_n[j] + h * k1[j] / 2
+        k2 = f(t_n + h / 2, tmp)
+        for j in range(order):
+            tmp[j] = y_n[j] + h * k2[j] / 2
+        k3 = f(t_n + h / 2, tmp)
+        for j in range(order):
+            tmp[j] = y_n[j] + h * k3[j]
+        k4 = f(t_n + h, tmp)
+
+        for j in range(order):
+            y[n + 1, j] = y_n[j] + h / 6 * (k1[j] + 2 * k2[j] + 2 * k3[j] + k4[j])
+
+
+def jit_integrate(loop, f, t, init_y):
+    t = np.asarray(t, dtype=float)
+    y = np.empty((len(t), len(init_y)))
+    y[0] = init_y
+    loop(f, t, y)
+    return y
+
+
+class JitEulerIntegrator(EulerIntegrator):
+    """
+    Euler integrator that compiles the full time loop if ``f`` is a
+    ``numba.njit`` function. Otherwise, it works just like ``EulerIntegrator``.
+    """
+
+    def integrate(self, f, t, init_y):
+        if is_jitted(f) and np.ndim(init_y) == 1:
+            return jit_integrate(euler_loop, f, t, init_y)
+        return super().integrate(f, t, init_y)
+
+
+class JitRK4Integrator(RK4Integrator):
+    """
+    RK4 integrator that compiles the full time loop if ``f`` is a
+    ``numba.njit`` function. Otherwise, it works just like ``RK4Integrator``.
+    """
+
+    def integrate(self, f, t, init_y):
+        if is_jitted(f) and np.ndim(init_y) == 1:
+            return jit_integrate(rk4_loop, f, t, init_y)
+        return super().integrate(f, t, init_y)
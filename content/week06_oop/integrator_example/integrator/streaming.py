@@ -0,0 +1,73 @@
+import numpy as np
+
+
+__all__ = ["integrate_chunks", "integrate_into", "output_length"]
+
+
+def __dir__():
+    return __all__
+
+
+def output_length(steps, decimate=1):
+    """Number of rows kept from ``steps`` points, keeping every ``decimate``-th."""
+    return (steps - 1) // decimate + 1
+
+
+def integrate_chunks(integrator, f, t, init_y, *, chunk_size=4096, decimate=1):
+    """
+    Integrate like ``integrator.integrate``, but yield the trajectory in pieces.
+
+    Yields ``(t_chunk, y_chunk)`` pairs with at most ``chunk_size`` rows each,
+    keeping every ``decimate``-th time point (the first point is always kept).
+    Only the current chunk is held in memory, so the trajectory can be much
+    longer than would fit in RAM. Steps are taken with
+    ``integrator.compute_step``.
+    """
+    steps = len(t)
+    y_n = np.asarray(init_y, dtype=float)
+
+    t_chunk = np.empty(chunk_size)
+    y_chunk = np.empty((chunk_size, *y_n.shape))
+    t_chunk[0] = t[0]
+    y_chunk[0] = y_n
+    filled = 1
+
+    for n in range(steps - 1):
+        h = t[n + 1] - t[n]
+        y_n = integrator.compute_step(f, t[n], y_n, h)
+
+        if (n + 1) % decimate == 0:
+            if filled == chunk_size:
+                yield t_chunk, y_chunk
+                t_chunk = np.empty(chunk_size)
+                y_chunk = np.empty((chunk_size, *y_n.shape))
+                filled = 0
+            t_chunk[filled] = t[n + 1]
+            y_chunk[filled] = y_n
+            filled += 1
+
+    yield t_chunk[:filled], y_chunk[:filled]
+
+
+def integrate_into(integrator, f, t, init_y, out, *, chunk_size=4096, decimate=1):
+    """
+    Stream a trajectory into ``out`` chunk by chunk, and return the rows written.
+
+    ``out`` can be an array (such as an ``np.memmap``) with
+    ``output_length(len(t), decimate)`` rows, or a callable that is called as
+    ``out(start, t_chunk, y_chunk)`` for each chunk.
+    """
+    start = 0
+    for t_chunk, y_chunk in integrate_chunks(
+        integrator, f, t, init_y, chunk_size=chunk_size, decimate=decimate
+    ):
+        if callable(out):
+            out(start, t_chunk, y_chunk)
+        else:
+            out[start : start + len(y_chunk)] = y_chunk
+        start += len(y_chunk)
+
+    if hasattr(out, "flush"):
+        out.flush()
+
+    return start
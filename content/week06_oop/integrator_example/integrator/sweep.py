@@ -0,0 +1,75 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+__all__ = ["sweep"]
+
+
+def __dir__():
+    return __all__
+
+
+def run_chunk(shm_name, shape, integrator, f, t, params, init_ys, start):
+    # Write results straight into the parent's array, so only the inputs
+    # are pickled when sending work to a worker.
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        for i, (p, init_y) in enumerate(zip(params, init_ys), start=start):
+            out[i] = integrator.integrate(lambda t_n, y_n: f(t_n, y_n, p), t, init_y)
+        del out
+    finally:
+        shm.close()
+
+
+def sweep(integrator, f, t, params, init_ys, *, max_workers=None, chunksize=None):
+    """
+    Integrate ``f(t, y, p)`` for each pair of ``params`` and ``init_ys``.
+
+    Each job is independent, so they are spread over a ``ProcessPoolExecutor``
+    in chunks of ``chunksize`` jobs. Workers write their trajectories into
+    shared memory, and the result is a single ``(n_jobs, steps, order)``
+    array. ``integrator`` and ``f`` need to be picklable (``f`` should be a
+    module-level function). ``init_ys`` can be a single initial condition,
+    used for every job.
+    """
+    params = list(params)
+    n_jobs = len(params)
+    init_ys = np.broadcast_to(init_ys, (n_jobs, *np.shape(init_ys)[-1:]))
+    shape = (n_jobs, len(t), init_ys.shape[-1])
+
+    if chunksize is None:
+        # A few chunks per worker balances the load without pickling much
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, math.ceil(n_jobs / (4 * workers)))
+
+    with ProcessPoolExecutor(max_workers) as pool:
+        shm = shared_memory.SharedMemory(
+            create=True, size=max(1, math.prod(shape) * np.dtype(float).itemsize)
+        )
+        try:
+            futures = [
+                pool.submit(
+                    run_chunk,
+                    shm.name,
+                    shape,
+                    integrator,
+                    f,
+                    t,
+                    params[start : start + chunksize],
+                    init_ys[start : start + chunksize],
+                    start,
+                )
+                for start in range(0, n_jobs, chunksize)
+            ]
+            for future in futures:
+                future.result()
+
+            return np.ndarray(shape, dtype=float, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,63 @@
+from integrator import RK4Integrator
+from integrator.adaptive import DormandPrinceIntegrator
+from pytest import approx
+import numpy as np
+
+
+def f(t, y):
+    "Y has two elements, x and v"
+    return np.array([-1 * y[1], y[0]])
+
+
+def test_dormand_prince():
+    ts = np.linspace(0, 40, 100 + 1)
+
+    integrator = DormandPrinceIntegrator(rtol=1e-8, atol=1e-10)
+    y = integrator.integrate(f, ts, [1, 0])
+
+    assert y[:, 0] == approx(np.cos(ts), abs=1e-6)
+    assert y[:, 1] == approx(np.sin(ts), abs=1e-6)
+    assert integrator.naccepted > 0
+    assert integrator.nfev > 6 * integrator.naccepted
+
+
+def test_dormand_prince_fewer_evaluations():
+    ts = np.linspace(0, 40, 10_000 + 1)
+
+    integrator = DormandPrinceIntegrator(rtol=1e-6, atol=1e-9)
+    y = integrator.integrate(f, ts, [1, 0])
+
+    # RK4 on this grid would take 4 * 10_000 evaluations
+    assert integrator.nfev < 4 * 10_000 / 10
+    assert y[:, 0] == approx(RK4Integrator().integrate(f, ts, [1, 0])[:, 0], abs=1e-4)
+
+
+def test_dormand_prince_rejects():
+    ts = np.linspace(0, 1, 11)
+
+    integrator = DormandPrinceIntegrator(first_step=1.0)
+    integrator.integrate(lambda t, y: -50 * y, ts, [1.0])
+
+    assert integrator.nrejected > 0
+
+
+def test_dormand_prince_ensemble():
+    ts = np.linspace(0, 10, 51)
+    init_y = np.array([[1, 0], [2, 0]])
+
+    integrator = DormandPrinceIntegrator(rtol=1e-8, atol=1e-10)
+    y = integrator.integrate(
+        lambda t, y: np.stack([-y[..., 1], y[..., 0]], axis=-1), ts, init_y
+    )
+
+    assert y.shape == (51, 2, 2)
+    assert y[:, 1, 0] == approx(2 * np.cos(ts), abs=1e-6)
+
+
+def test_dormand_prince_backwards():
+    t = np.linspace(10, 0, 51)
+    integrator = DormandPrinceIntegrator()
+    y = integrator.integrate(lambda t, y: y, t, [np.exp(10)])
+
+    np.testing.assert_allclose(y[:, 0], np.exp(t), rtol=1e-5)
+    assert integrator.naccepted < 1000
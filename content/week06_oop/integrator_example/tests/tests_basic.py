@@ -24,3 +24,31 @@ def test_rk4():
     y = integrator.integrate(f, ts, [1, 0])
 
     assert y[:, 0] == approx(np.cos(ts), rel=0.01, abs=0.01)
+
+
+def f_ensemble(t, y):
+    "Y has shape (n_traj, 2), with x and v in the last axis"
+    return np.stack([-1 * y[..., 1], y[..., 0]], axis=-1)
+
+
+def test_rk4_ensemble():
+    ts = np.linspace(0, 40, 100 + 1)
+    init_y = np.array([[1, 0], [2, 0], [0, 1]])
+
+    integrator = RK4Integrator()
+    y = integrator.integrate(f_ensemble, ts, init_y)
+
+    assert y.shape == (len(ts), 3, 2)
+    for i, y0 in enumerate(init_y):
+        assert y[:, i] == approx(integrator.integrate(f, ts, y0))
+
+
+def test_euler_ensemble():
+    ts = np.linspace(0, 4, 100 + 1)
+    init_y = np.array([[1, 0], [2, 0]])
+
+    integrator = EulerIntegrator()
+    y = integrator.integrate(f_ensemble, ts, init_y)
+
+    assert y.shape == (len(ts), 2, 2)
+    assert y[:, 1, 0] == approx(2 * np.cos(ts), rel=0.1, abs=0.2)
@@ -0,0 +1,40 @@
+from integrator import EulerIntegrator, RK4Integrator
+from pytest import approx
+import numpy as np
+import pytest
+
+numba = pytest.importorskip("numba")
+
+from integrator.jit import JitEulerIntegrator, JitRK4Integrator  # noqa: E402
+
+
+def f(t, y):
+    "Y has two elements, x and v"
+    return np.array([-1 * y[1], y[0]])
+
+
+f_jit = numba.njit(f)
+
+
+def test_jit_euler():
+    ts = np.linspace(0, 4, 100 + 1)
+
+    y = JitEulerIntegrator().integrate(f_jit, ts, [1, 0])
+
+    assert y == approx(EulerIntegrator().integrate(f, ts, [1, 0]))
+
+
+def test_jit_rk4():
+    ts = np.linspace(0, 40, 100 + 1)
+
+    y = JitRK4Integrator().integrate(f_jit, ts, [1, 0])
+
+    assert y == approx(RK4Integrator().integrate(f, ts, [1, 0]))
+
+
+def test_jit_fallback():
+    ts = np.linspace(0, 40, 100 + 1)
+
+    y = JitRK4Integrator().integrate(f, ts, [1, 0])
+
+    assert y[:, 0] == approx(np.cos(ts), rel=0.01, abs=0.01)
@@ -0,0 +1,58 @@
+from integrator import RK4Integrator
+from integrator.streaming import integrate_chunks, integrate_into, output_length
+from pytest import approx
+import numpy as np
+
+
+def f(t, y):
+    "Y has two elements, x and v"
+    return np.array([-1 * y[1], y[0]])
+
+
+def test_chunks_match_integrate():
+    ts = np.linspace(0, 40, 100 + 1)
+
+    integrator = RK4Integrator()
+    chunks = list(integrate_chunks(integrator, f, ts, [1, 0], chunk_size=16))
+
+    assert all(len(y) <= 16 for _, y in chunks)
+    assert np.concatenate([t for t, _ in chunks]) == approx(ts)
+    assert np.concatenate([y for _, y in chunks]) == approx(
+        integrator.integrate(f, ts, [1, 0])
+    )
+
+
+def test_chunks_decimate():
+    ts = np.linspace(0, 40, 100 + 1)
+
+    integrator = RK4Integrator()
+    chunks = list(integrate_chunks(integrator, f, ts, [1, 0], chunk_size=8, decimate=3))
+    y = np.concatenate([y for _, y in chunks])
+
+    assert len(y) == output_length(len(ts), 3)
+    assert y == approx(integrator.integrate(f, ts, [1, 0])[::3])
+
+
+def test_into_memmap(tmp_path):
+    ts = np.linspace(0, 40, 100 + 1)
+
+    out = np.memmap(
+        tmp_path / "traj.dat", dtype=float, mode="w+", shape=(output_length(101, 2), 2)
+    )
+    integrator = RK4Integrator()
+    rows = integrate_into(integrator, f, ts, [1, 0], out, chunk_size=10, decimate=2)
+
+    assert rows == 51
+    assert np.asarray(out) == approx(integrator.integrate(f, ts, [1, 0])[::2])
+
+
+def test_into_callback():
+    ts = np.linspace(0, 4, 20 + 1)
+    starts = []
+
+    def sink(start, t_chunk, y_chunk):
+        starts.append(start)
+
+    integrate_into(RK4Integrator(), f, ts, [1, 0], sink, chunk_size=8)
+
+    assert starts == [0, 8, 16]
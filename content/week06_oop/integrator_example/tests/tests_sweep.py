@@ -0,0 +1,29 @@
+from integrator import RK4Integrator
+from integrator.sweep import sweep
+from pytest import approx
+import numpy as np
+
+
+def f(t, y, omega):
+    "Y has two elements, x and v"
+    return np.array([-omega * y[1], omega * y[0]])
+
+
+def test_sweep():
+    ts = np.linspace(0, 4, 100 + 1)
+    omegas = [0.5, 1.0, 1.5, 2.0, 2.5]
+
+    y = sweep(RK4Integrator(), f, ts, omegas, [1, 0], max_workers=2, chunksize=2)
+
+    assert y.shape == (5, len(ts), 2)
+    for i, omega in enumerate(omegas):
+        assert y[i, :, 0] == approx(np.cos(omega * ts), rel=0.01, abs=0.01)
+
+
+def test_sweep_init_ys():
+    ts = np.linspace(0, 4, 100 + 1)
+    init_ys = np.array([[1, 0], [2, 0], [3, 0]])
+
+    y = sweep(RK4Integrator(), f, ts, [1.0] * 3, init_ys, max_workers=2)
+
+    assert y[:, :, 0] == approx(init_ys[:, :1] * np.cos(ts), rel=0.01, abs=0.01)
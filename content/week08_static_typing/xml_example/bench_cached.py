@@ -0,0 +1,36 @@
+import timeit
+
+import xml
+import xml.cached as cached
+
+
+def document(x):
+    return x.Html(
+        *(
+            x.Div(*(x.P(f"Paragraph {i}.{j}") for j in range(1000)), id=f"div{i}")
+            for i in range(100)
+        )
+    )
+
+
+plain = document(xml)
+doc = document(cached)
+leaf = doc.content[50].content[500]
+
+assert str(plain) == str(doc)
+
+n = 10
+plain_time = timeit.timeit(lambda: str(plain), number=n) / n
+first_time = timeit.timeit(lambda: str(document(cached)), number=1)
+
+
+def edit_and_render():
+    leaf.attributes["class"] = "changed"
+    return str(doc)
+
+
+cached_time = timeit.timeit(edit_and_render, number=n) / n
+
+print(f"Uncached render:              {plain_time * 1000:8.2f} ms")
+print(f"Cached, first render + build: {first_time * 1000:8.2f} ms")
+print(f"Cached, re-render after edit: {cached_time * 1000:8.2f} ms")
@@ -0,0 +1,14 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+# This package is called xml, and pytest has already imported the standard
+# library's xml, so load the example under another name. Run pytest from
+# outside this example's directory, or the package hides xml from pytest too.
+PACKAGE = Path(__file__).parent.parent / "xml"
+spec = importlib.util.spec_from_file_location(
+    "xml_example", PACKAGE / "__init__.py", submodule_search_locations=[str(PACKAGE)]
+)
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
@@ -0,0 +1,32 @@
+import gc
+
+import xml_example as xml
+import xml_example.cached as cached  # noqa: PLR0402 (from-import gets a tag)
+
+
+def test_same_text():
+    def document(x):
+        return x.Div(x.P("Some", x.B("bold"), "text"), x.Br(), id="main")
+
+    assert str(document(cached)) == str(document(xml))
+
+
+def test_edit_invalidates_parents():
+    leaf = cached.P("Hello")
+    doc = cached.Body(cached.Div(leaf))
+    str(doc)
+
+    leaf.attributes["class"] = "changed"
+    assert str(doc) == str(xml.Body(xml.Div(xml.P("Hello", **{"class": "changed"}))))
+
+    leaf.content = ["Bye"]
+    assert "Bye" in str(doc)
+
+
+def test_discarded_parents_released():
+    leaf = cached.P("Hello")
+    for _ in range(1000):
+        str(cached.Div(leaf))
+    gc.collect()
+
+    assert len(leaf.parents) == 0
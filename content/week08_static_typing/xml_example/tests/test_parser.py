@@ -0,0 +1,65 @@
+import io
+import tracemalloc
+
+import xml_example as xml
+import xml_example.parser as parser  # noqa: PLR0402 (from-import gets a tag)
+
+DOC = xml.Html(
+    xml.Head(xml.Title("Parsing")),
+    xml.Body(
+        xml.H1("Hello", id="top"),
+        xml.P("Some", xml.B("bold"), "text", style="color: red"),
+        xml.Br(),
+    ),
+)
+
+
+def as_file(doc):
+    return io.BytesIO(str(doc).encode())
+
+
+def test_round_trip():
+    assert str(parser.parse(as_file(DOC))) == str(DOC)
+
+
+def test_round_trip_small_chunks():
+    assert str(parser.parse(as_file(DOC), chunk_size=1)) == str(DOC)
+
+
+def test_iterparse_all():
+    names = [element.name for element in parser.iterparse(as_file(DOC))]
+    assert names == ["title", "head", "h1", "b", "p", "br", "body", "html"]
+
+
+def test_iterparse_tag():
+    doc = xml.Root(*(xml.Row(xml.Rec(xml.Item(str(i)), id=str(i))) for i in range(5)))
+    recs = list(parser.iterparse(as_file(doc), "rec", chunk_size=7))
+    assert [str(r) for r in recs] == [str(r.content[0]) for r in doc.content]
+
+
+def test_iterparse_tag_nested():
+    doc = b"<root><item id='1'><item id='2'>inner</item> tail</item></root>"
+    inner, outer = parser.iterparse(io.BytesIO(doc), "item")
+    assert str(inner) == '<item id="2">inner</item>\n'
+    assert str(outer) == str(xml.Item(xml.Item("inner", id="2"), "tail", id="1"))
+
+
+def test_iterparse_tag_memory():
+    def peak(n):
+        doc = "<root>" + "<row><rec/></row>" * n + "</root>"
+        file = io.BytesIO(doc.encode())
+        tracemalloc.start()
+        for _ in parser.iterparse(file, "rec", chunk_size=1024):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    # Nothing outside the records is kept, so the peak doesn't grow with n
+    assert peak(50_000) < 2 * peak(5_000)
+
+
+def test_parse_reuses_classes():
+    root = parser.parse(as_file(DOC))
+    assert type(root) is xml.Html
+    assert type(root.content[1].content[0]) is xml.H1
@@ -0,0 +1,46 @@
+import io
+import sys
+
+import xml_example as xml
+
+DOC = xml.Html(
+    xml.Body(
+        xml.H1("Title", id="top"),
+        xml.P("Number", 42, xml.B("bold"), style="color: red"),
+        xml.Br(),
+        xml.Img(src="a.png", alt="A"),
+        xml.Div(),
+    ),
+    lang="en",
+)
+
+
+def test_iter_chunks():
+    assert "".join(DOC.iter_chunks()) == str(DOC)
+
+
+def test_write_binary():
+    file = io.BytesIO()
+    DOC.write(file, buffer_size=8)
+    assert file.getvalue() == str(DOC).encode()
+
+
+def test_write_text():
+    file = io.StringIO()
+    DOC.write(file, buffer_size=8)
+    assert file.getvalue() == str(DOC)
+
+
+def test_deep_tree():
+    depth = sys.getrecursionlimit() + 100
+    doc = xml.Leaf("bottom")
+    for _ in range(depth):
+        doc = xml.Div(doc)
+
+    text = "".join(doc.iter_chunks())
+    assert text.startswith("<div>" * depth + "<leaf>bottom</leaf>\n</div>\n")
+    assert text.count("</div>\n") == depth
+
+    file = io.StringIO()
+    doc.write(file)
+    assert file.getvalue() == text
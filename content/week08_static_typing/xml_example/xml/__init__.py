@@ -1,4 +1,5 @@
 import functools
+import io
 
 
 class XML:
@@ -17,6 +18,50 @@ class XML:
             return f"<{self.name}{attributes}>{content}</{self.name}>\n"
         return f"<{self.name}{attributes}/>"
 
+    def iter_chunks(self):
+        """
+        Yield the same text as ``str(self)``, in pieces. This walks the tree
+        with an explicit stack, so deep trees don't hit the recursion limit.
+        """
+        stack = [self]  # Elements still to render, or text to output
+        while stack:
+            item = stack.pop()
+            if not isinstance(item, XML):
+                yield str(item)
+                continue
+
+            attributes = "".join(f' {k}="{v}"' for k, v in item.attributes.items())
+            if not item.content:
+                yield f"<{item.name}{attributes}/>"
+                continue
+
+            yield f"<{item.name}{attributes}>"
+            stack.append(f"</{item.name}>\n")
+            for i in reversed(range(len(item.content))):
+                stack.append(item.content[i])
+                if i:
+                    stack.append(" ")
+
+    def write(self, file, *, encoding="utf-8", buffer_size=64 * 1024):
+        """
+        Write the same text as ``str(self)`` to a text or binary file (such
+        as ``socket.makefile("wb")``), about ``buffer_size`` characters at a
+        time.
+        """
+        text = isinstance(file, io.TextIOBase)
+        buffer = []
+        size = 0
+        for chunk in self.iter_chunks():
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= buffer_size:
+                data = "".join(buffer)
+                file.write(data if text else data.encode(encoding))
+                buffer.clear()
+                size = 0
+        data = "".join(buffer)
+        file.write(data if text else data.encode(encoding))
+
 
 @functools.cache
 def __getattr__(name):
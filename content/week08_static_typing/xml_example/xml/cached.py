@@ -0,0 +1,97 @@
+import functools
+import weakref
+
+from . import XML
+
+
+class Attributes(dict):
+    """A dict of attributes that invalidates its element when changed."""
+
+    def __init__(self, element, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.element = element
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.element.invalidate()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.element.invalidate()
+
+    def clear(self):
+        super().clear()
+        self.element.invalidate()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self.element.invalidate()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self.element.invalidate()
+        return result
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self.element.invalidate()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.element.invalidate()
+
+
+class CachedXML(XML):
+    """
+    An XML element that remembers its rendered text. Setting ``content``,
+    or changing ``attributes``, clears the cache for this element and the
+    elements that contain it, so re-rendering after a small edit only
+    re-renders the path up to the root.
+
+    Use ``import xml.cached`` to make these (``from xml import cached``
+    would make a tag called ``cached`` instead).
+    """
+
+    def __init__(self, *content, **attributes):
+        self.parents = weakref.WeakSet()  # Don't keep discarded parents alive
+        self.rendered = None
+        super().__init__(*content, **attributes)
+
+    def __setattr__(self, name, value):
+        if name == "content":
+            value = tuple(value)
+            for child in getattr(self, "content", ()):
+                if isinstance(child, CachedXML):
+                    child.parents.discard(self)
+            for child in value:
+                if isinstance(child, CachedXML):
+                    child.parents.add(self)
+        elif name == "attributes":
+            value = Attributes(self, value)
+
+        super().__setattr__(name, value)
+
+        if name in {"content", "attributes"}:
+            self.invalidate()
+
+    def invalidate(self):
+        # A rendered element only contains rendered elements, so we can stop
+        # at anything that is already invalid
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            if element.rendered is not None:
+                element.rendered = None
+                stack.extend(element.parents)
+
+    def __str__(self):
+        if self.rendered is None:
+            self.rendered = super().__str__()
+        return self.rendered
+
+
+@functools.cache
+def __getattr__(name):
+    return type(name, (CachedXML,), {})
@@ -0,0 +1,76 @@
+import pyexpat  # Our package hides the standard library's xml.parsers.expat
+
+from . import __getattr__ as tag_class
+
+
+def iterparse(file, tag=None, *, chunk_size=64 * 1024):
+    """
+    Read XML from a binary file (or anything with ``.read``, such as an
+    ``mmap``) in chunks, and yield ``XML`` elements as they are completed.
+
+    If ``tag`` is given, only elements with that name are yielded, and only
+    their contents are kept; they aren't added to their parents (unless
+    nested inside another match), and nothing outside of them is kept
+    either, so memory is bounded by the largest of these elements rather
+    than by the document. Text is stripped, and
+    whitespace-only text is dropped, matching how ``str()`` lays out content.
+    """
+    parser = pyexpat.ParserCreate()
+    stack = []  # (name, attributes, content, text) for each open element
+    matching = 0  # Number of open elements named tag
+    done = []
+
+    def keep():
+        # With a tag, only elements inside a match need their content
+        return tag is None or matching > 0
+
+    def flush_text(content, text):
+        joined = "".join(text).strip()
+        if joined:
+            content.append(joined)
+        text.clear()
+
+    def start(name, attributes):
+        nonlocal matching
+        if stack:
+            _, _, content, text = stack[-1]
+            flush_text(content, text)
+        stack.append((name, attributes, [], []))
+        if name == tag:
+            matching += 1
+
+    def end(name):
+        nonlocal matching
+        _, attributes, content, text = stack.pop()
+        flush_text(content, text)
+        if name == tag:
+            matching -= 1
+        elif not keep():
+            return
+        element = tag_class(name.capitalize())(*content, **attributes)
+        if tag is None or name == tag:
+            done.append(element)
+        if stack and keep():  # Matches inside other matches are kept too
+            stack[-1][2].append(element)
+
+    def characters(data):
+        if stack and keep():
+            stack[-1][3].append(data)
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = characters
+
+    while chunk := file.read(chunk_size):
+        parser.Parse(chunk, False)
+        yield from done
+        done.clear()
+
+    parser.Parse(b"", True)
+    yield from done
+
+
+def parse(file, *, chunk_size=64 * 1024):
+    """Read a whole XML document from a binary file and return the root."""
+    *_, root = iterparse(file, chunk_size=chunk_size)
+    return root
@@ -0,0 +1,39 @@
+import random
+import time
+
+import eventloop
+import heaploop
+
+LONGEST = 0.5  # Longest sleep, in seconds
+
+
+def counted(task, counter):
+    # Count how many times the loop resumes the task
+    for res in task:
+        counter[0] += 1
+        yield res
+    counter[0] += 1  # The resume that finished it
+
+
+def run(loop, n):
+    rng = random.Random(0)
+    resumes = [0]
+    tasks = [
+        counted(eventloop.sleep(rng.uniform(0, LONGEST)), resumes) for _ in range(n)
+    ]
+    # CPU time, since the wall time is mostly spent asleep either way
+    start = time.process_time()
+    results = sum(1 for _ in loop(tasks))
+    assert results == n
+    return time.process_time() - start, resumes[0] / n
+
+
+if __name__ == "__main__":
+    print(f"Sleeping tasks, {LONGEST}s at most (CPU time, resumes per task):")
+    for n in (1_000, 10_000, 100_000):
+        poll, poll_resumes = run(eventloop.event_loop, n)
+        heap, heap_resumes = run(heaploop.event_loop, n)
+        print(
+            f"{n:>7,}: polling {poll:.2f}s, {poll_resumes:.1f};"
+            f" heap {heap:.2f}s, {heap_resumes:.1f}"
+        )
@@ -8,7 +8,7 @@ class NotReady(float):
 def event_loop(tasks):
     while tasks:  # Stops when all tasks are done
         waits = []
-        for task in tasks:
+        for task in list(tasks):  # Copy, since finished tasks are removed
             try:
                 res = task.send(None)  # async function runs here
                 if isinstance(res, NotReady):
@@ -23,9 +23,10 @@ def event_loop(tasks):
 
 def sleep(t):
     endtime = time.time() + t
-    while time.time() < endtime:
-        yield NotReady(endtime - time.time())
+    while (remaining := endtime - time.time()) > 0:
+        yield NotReady(remaining)
     yield f"Sleep {t} over"
 
 
-print(*event_loop([sleep(3), sleep(2), sleep(1), sleep(4)]), sep="\n")
+if __name__ == "__main__":
+    print(*event_loop([sleep(3), sleep(2), sleep(1), sleep(4)]), sep="\n")
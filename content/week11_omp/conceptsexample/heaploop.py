@@ -0,0 +1,38 @@
+import collections
+import heapq
+import itertools
+import time
+
+from eventloop import NotReady, sleep
+
+
+def event_loop(tasks):
+    ready = collections.deque(tasks)  # Tasks that can run now
+    timers = []  # Heap of (deadline, tiebreak, task) for waiting tasks
+    counter = itertools.count()  # Tasks can't be compared, so break ties first
+
+    while ready or timers:
+        if not ready:
+            # Nothing to do, so sleep until the earliest deadline
+            time.sleep(max(0, timers[0][0] - time.monotonic()))
+
+        # Move every task that is due into the ready queue
+        now = time.monotonic()
+        while timers and timers[0][0] <= now:
+            ready.append(heapq.heappop(timers)[2])
+
+        for _ in range(len(ready)):  # Tasks made ready now wait a round
+            task = ready.popleft()
+            try:
+                res = task.send(None)  # async function runs here
+            except StopIteration:
+                continue  # Task done, just don't put it back
+            if isinstance(res, NotReady):
+                heapq.heappush(timers, (time.monotonic() + res, next(counter), task))
+            else:
+                ready.append(task)
+                yield res  # Produce result
+
+
+if __name__ == "__main__":
+    print(*event_loop([sleep(3), sleep(2), sleep(1), sleep(4)]), sep="\n")
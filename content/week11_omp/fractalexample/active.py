@@ -0,0 +1,80 @@
+import numpy as np
+
+from single import prepare, timer
+
+
+def compute_active(c, fractal, maxiterations=20):
+    """
+    Same result as ``single.run`` (for any ``|c| <= 2``), but only the points
+    that haven't diverged are iterated. They are packed together, and each
+    step is done in place with ``out=`` on preallocated buffers, so the cost
+    of an iteration scales with the number of surviving points.
+    """
+    result = np.array(fractal).reshape(-1)
+    size = result.size
+
+    # Two of each buffer, so packing never reads and writes the same memory
+    zs = np.empty((2, size), dtype=np.complex128)
+    cs = np.empty((2, size), dtype=np.complex128)
+    indices = np.empty((2, size), dtype=np.intp)
+    magnitude = np.empty(size)
+    diverge = np.empty(size, dtype=bool)
+    keep = np.empty(size, dtype=bool)
+
+    current = 0
+    z, c_active, index = zs[0], cs[0], indices[0]
+    c_active[...] = c.reshape(-1)
+    z[...] = c_active
+    index[...] = np.arange(size)
+    n = size
+
+    for i in range(1, maxiterations + 1):
+        z_n, c_n, index_n = z[:n], c_active[:n], index[:n]
+        np.multiply(z_n, z_n, out=z_n)
+        np.add(z_n, c_n, out=z_n)  # Compute z
+        np.abs(z_n, out=magnitude[:n])
+        np.greater(magnitude[:n], 2, out=diverge[:n])  # Divergence criteria
+
+        escaped = np.count_nonzero(diverge[:n])
+        if escaped == 0:
+            continue
+
+        # Points that diverge now last survived the previous iteration
+        if i > 1:
+            result[index_n[diverge[:n]]] = i - 1
+
+        # Pack the survivors into the other buffers
+        np.logical_not(diverge[:n], out=keep[:n])
+        current = 1 - current
+        m = n - escaped
+        np.compress(keep[:n], z_n, out=zs[current, :m])
+        np.compress(keep[:n], c_n, out=cs[current, :m])
+        np.compress(keep[:n], index_n, out=indices[current, :m])
+        z, c_active, index = zs[current], cs[current], indices[current]
+        n = m
+
+        if n == 0:
+            break
+
+    if maxiterations >= 1:
+        result[index[:n]] = maxiterations
+    fractal[...] = result.reshape(fractal.shape)
+
+
+if __name__ == "__main__":
+    from tiled import compute
+
+    size = 1000, 750
+    maxiterations = 1000
+
+    c, fractal = prepare(*size)
+    print("Full grid:")
+    with timer():
+        compute(c, fractal, maxiterations)
+
+    c, active = prepare(*size)
+    print("Active set:")
+    with timer():
+        compute_active(c, active, maxiterations)
+
+    print(f"Same result: {np.array_equal(fractal, active)}")
@@ -0,0 +1,92 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from single import timer
+from tiled import compute
+
+
+def grid_axes(height, width):
+    # The open grid that prepare() broadcasts, only height + width values
+    return np.ogrid[-1j : 0j : height * 1j, -1.5 : 0 : width * 1j]
+
+
+def render_tile(kernel, rows, cols, out, start, stop, maxiterations):
+    c = rows[start:stop] + cols  # Same values as prepare(), for these rows only
+    fractal = np.zeros(c.shape, dtype=np.int32)
+    kernel(c, fractal, maxiterations)
+    out[start:stop] = fractal
+    return start, stop
+
+
+def render_to_file(
+    filename,
+    height,
+    width,
+    maxiterations=20,
+    *,
+    tile_rows=256,
+    workers=1,
+    kernel=compute,
+):
+    """
+    Render the fractal into a ``.npy`` file through a memory map, one block
+    of ``tile_rows`` rows at a time, so memory use depends on the tile size
+    and not the image size. Finished tiles are recorded in a ``.progress``
+    file next to it, so an interrupted render picks up where it left off.
+    Read the result with ``np.load(filename, mmap_mode="r")``.
+    """
+    filename = Path(filename)
+    progress_file = filename.with_name(filename.name + ".progress")
+    settings = {
+        "height": height,
+        "width": width,
+        "maxiterations": maxiterations,
+        "tile_rows": tile_rows,
+    }
+
+    done = set()
+    if filename.exists() and progress_file.exists():
+        progress = json.loads(progress_file.read_text())
+        if progress["settings"] == settings:
+            done = set(progress["done"])
+
+    if done:
+        out = np.lib.format.open_memmap(filename, mode="r+")
+    else:
+        out = np.lib.format.open_memmap(
+            filename, mode="w+", dtype=np.int32, shape=(height, width)
+        )
+
+    rows, cols = grid_axes(height, width)
+    tiles = [
+        (start, min(start + tile_rows, height))
+        for start in range(0, height, tile_rows)
+        if start not in done
+    ]
+
+    with ThreadPoolExecutor(workers) as pool:
+        finished = pool.map(
+            lambda tile: render_tile(kernel, rows, cols, out, *tile, maxiterations),
+            tiles,
+        )
+        for start, stop in finished:
+            # Make sure the data is on disk before saying the tile is done
+            out.flush()
+            done.add(start)
+            tmp = progress_file.with_name(progress_file.name + ".tmp")
+            tmp.write_text(json.dumps({"settings": settings, "done": sorted(done)}))
+            os.replace(tmp, progress_file)
+
+    return out
+
+
+if __name__ == "__main__":
+    size = 4000, 3000
+
+    with timer():
+        fractal = render_to_file("fractal.npy", *size, workers=4)
+    print(f"{fractal.shape=}, {fractal.dtype=}")
@@ -0,0 +1,121 @@
+import collections
+import math
+
+import numpy as np
+
+from single import timer
+from tiled import compute
+
+# Size of one pixel at level 0; each level halves it
+SCALE = 1 / 64
+
+
+class ProgressiveRenderer:
+    """
+    Render any region of the fractal, coarse first and then finer, from
+    square tiles on a fixed lattice for each level of detail. Tiles are
+    cached by (level, tile x, tile y, maxiterations), so panning and zooming
+    reuse tiles that have been computed before. The least recently used
+    tiles are dropped when the cache is over ``max_bytes``.
+    """
+
+    def __init__(
+        self, maxiterations=20, *, tile_size=128, max_bytes=256 * 2**20, kernel=compute
+    ):
+        self.maxiterations = maxiterations
+        self.tile_size = tile_size
+        self.max_bytes = max_bytes
+        self.kernel = kernel
+
+        self.cache = collections.OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def tile(self, level, tx, ty, maxiterations):
+        key = (level, tx, ty, maxiterations)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+        self.misses += 1
+
+        pixel = math.ldexp(SCALE, -level)
+        offsets = np.arange(self.tile_size) + 0.5
+        x = (tx * self.tile_size + offsets) * pixel
+        y = (ty * self.tile_size + offsets) * pixel
+        c = x[np.newaxis, :] + 1j * y[:, np.newaxis]
+        fractal = np.zeros(c.shape, dtype=np.int32)
+        self.kernel(c, fractal, maxiterations)
+
+        self.cache[key] = fractal
+        self.nbytes += fractal.nbytes
+        while self.nbytes > self.max_bytes and len(self.cache) > 1:
+            _, old = self.cache.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+        return fractal
+
+    def render_level(self, level, xmin, xmax, ymin, ymax, width, height, maxiterations):
+        """Sample the view from the tiles of one level (nearest pixel)."""
+        pixel = math.ldexp(SCALE, -level)
+        x = xmin + (np.arange(width) + 0.5) * (xmax - xmin) / width
+        y = ymin + (np.arange(height) + 0.5) * (ymax - ymin) / height
+        gx = np.floor(x / pixel).astype(np.int64)
+        gy = np.floor(y / pixel).astype(np.int64)
+
+        size = self.tile_size
+        tx0, tx1 = gx[0] // size, gx[-1] // size
+        ty0, ty1 = gy[0] // size, gy[-1] // size
+        mosaic = np.block(
+            [
+                [self.tile(level, tx, ty, maxiterations) for tx in range(tx0, tx1 + 1)]
+                for ty in range(ty0, ty1 + 1)
+            ]
+        )
+        return mosaic[np.ix_(gy - ty0 * size, gx - tx0 * size)]
+
+    def render(
+        self, xmin, xmax, ymin, ymax, width, height, *, levels=3, maxiterations=None
+    ):
+        """
+        Yield ``levels`` images of shape ``(height, width)`` for the region,
+        from coarse to fine. The last one has at least one lattice pixel per
+        output pixel. Rows go from ``ymin`` to ``ymax``, like ``prepare()``.
+        """
+        if maxiterations is None:
+            maxiterations = self.maxiterations
+
+        resolution = max(width / (xmax - xmin), height / (ymax - ymin))
+        finest = math.ceil(math.log2(SCALE * resolution))
+        for level in range(finest - levels + 1, finest + 1):
+            yield self.render_level(
+                level, xmin, xmax, ymin, ymax, width, height, maxiterations
+            )
+
+    def cache_info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "tiles": len(self.cache),
+            "nbytes": self.nbytes,
+        }
+
+
+if __name__ == "__main__":
+    renderer = ProgressiveRenderer()
+    size = 800, 600
+
+    print("First view:")
+    with timer():
+        *_, fractal = renderer.render(-1.5, 0, -1, 0, size[1], size[0])
+
+    print("Panned a little:")
+    with timer():
+        *_, fractal = renderer.render(-1.4, 0.1, -1, 0, size[1], size[0])
+
+    print("Zoomed in 2x:")
+    with timer():
+        *_, fractal = renderer.render(-1.025, -0.275, -0.75, -0.25, size[1], size[0])
+
+    print(renderer.cache_info())
@@ -32,7 +32,8 @@ def run(c, fractal, maxiterations=20):
         fractal[~diverge] = i  # Fill in non-diverged iteration number
 
 
-size = 4000, 3000
+if __name__ == "__main__":
+    size = 4000, 3000
 
-c, fractal = prepare(*size)
-fractal = run(c, fractal)
+    c, fractal = prepare(*size)
+    run(c, fractal)
@@ -0,0 +1,120 @@
+import contextlib
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from single import prepare, timer
+
+
+def compute(c, fractal, maxiterations=20):
+    # Same as single.run, without the timer
+    z = c
+
+    for i in range(1, maxiterations + 1):
+        z = z**2 + c  # Compute z
+        diverge = abs(z) > 2  # Divergence criteria
+
+        z[diverge] = 2  # Keep number size small
+        fractal[~diverge] = i  # Fill in non-diverged iteration number
+
+
+def run_tile(kernel, c, fractal, start, stop, maxiterations):
+    begin = time.perf_counter()
+    kernel(c[start:stop], fractal[start:stop], maxiterations)
+    return {
+        "start": start,
+        "stop": stop,
+        "seconds": time.perf_counter() - begin,
+        "worker": f"{os.getpid()}:{threading.get_ident()}",
+    }
+
+
+@contextlib.contextmanager
+def attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        yield np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    finally:
+        shm.close()
+
+
+def run_shared_tile(kernel, c_name, fractal_name, shape, start, stop, maxiterations):
+    with (
+        attach(c_name, shape, np.complex128) as c,
+        attach(fractal_name, shape, np.int32) as fractal,
+    ):
+        timing = run_tile(kernel, c, fractal, start, stop, maxiterations)
+        del c, fractal  # Release the buffers before closing
+    return timing
+
+
+def run_tiled(
+    c,
+    fractal,
+    maxiterations=20,
+    *,
+    tile_rows=100,
+    workers=None,
+    processes=False,
+    kernel=compute,
+):
+    """
+    Fill in ``fractal`` by splitting the grid into blocks of ``tile_rows``
+    rows, computed in parallel. Threads work directly on views, since NumPy
+    releases the GIL; with ``processes=True``, the grid is placed in shared
+    memory instead. Returns a list of timings for each tile.
+    """
+    tiles = [(i, min(i + tile_rows, len(c))) for i in range(0, len(c), tile_rows)]
+
+    if not processes:
+        with ThreadPoolExecutor(workers) as pool:
+            futures = [
+                pool.submit(run_tile, kernel, c, fractal, start, stop, maxiterations)
+                for start, stop in tiles
+            ]
+            return [f.result() for f in futures]
+
+    c_shm = shared_memory.SharedMemory(create=True, size=c.nbytes)
+    fractal_shm = shared_memory.SharedMemory(create=True, size=fractal.nbytes)
+    try:
+        np.ndarray(c.shape, np.complex128, c_shm.buf)[...] = c
+        np.ndarray(c.shape, np.int32, fractal_shm.buf)[...] = fractal
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [
+                pool.submit(
+                    run_shared_tile,
+                    kernel,
+                    c_shm.name,
+                    fractal_shm.name,
+                    c.shape,
+                    start,
+                    stop,
+                    maxiterations,
+                )
+                for start, stop in tiles
+            ]
+            timings = [f.result() for f in futures]
+        fractal[...] = np.ndarray(c.shape, np.int32, fractal_shm.buf)
+        return timings
+    finally:
+        for shm in (c_shm, fractal_shm):
+            shm.close()
+            shm.unlink()
+
+
+if __name__ == "__main__":
+    size = 4000, 3000
+
+    for processes in (False, True):
+        c, fractal = prepare(*size)
+        with timer():
+            timings = run_tiled(c, fractal, processes=processes)
+        seconds = [t["seconds"] for t in timings]
+        print(
+            f"{processes=}: {len(timings)} tiles,"
+            f" {min(seconds):.3}s to {max(seconds):.3}s per tile"
+        )
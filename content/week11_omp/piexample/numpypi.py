@@ -0,0 +1,40 @@
+import contextlib
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+@contextlib.contextmanager
+def timer():
+    start = time.monotonic()
+    yield
+    print(f"Took {time.monotonic() - start:.3}s to run")
+
+
+def pi_each(trials: int, batch_size: int = 100_000) -> float:
+    Ncirc = 0
+    rng = np.random.default_rng()
+
+    # Fixed-size batches keep memory use the same for any number of trials
+    buffer = np.empty(2 * batch_size)
+    for start in range(0, trials, batch_size):
+        n = min(batch_size, trials - start)
+        xy = buffer[: 2 * n]
+        rng.random(out=xy)  # A quarter circle is enough for pi / 4
+        np.square(xy, out=xy)
+        Ncirc += int(np.count_nonzero(xy[:n] + xy[n:] <= 1))
+
+    return 4.0 * (Ncirc / trials)
+
+
+@timer()
+def pi(trials: int, threads: int) -> float:
+    with ThreadPoolExecutor() as pool:
+        futures = pool.map(pi_each, [trials // threads] * threads)
+        return statistics.mean(futures)
+
+
+if __name__ == "__main__":
+    print(f"{pi(10_000_000, 10)=}")
@@ -0,0 +1,44 @@
+"""
+The pi examples as selectable backends behind one function. Every backend
+uses the chunked, seeded random streams from ``pibench.seeded``, so they all
+give the same answer for the same seed.
+"""
+
+import sys
+import sysconfig
+
+from .backends import BACKENDS
+from .seeded import count_numpy, count_python, make_chunks
+
+__all__ = ["BACKENDS", "ENGINES", "build_info", "pi"]
+
+ENGINES = {"python": count_python, "numpy": count_numpy}
+
+
+def __dir__():
+    return __all__
+
+
+def pi(
+    trials: int,
+    workers: int = 1,
+    seed: int | None = None,
+    *,
+    backend: str = "threadexec",
+    engine: str = "numpy",
+) -> float:
+    chunks = make_chunks(trials, seed)
+    work = [chunks[i::workers] for i in range(workers)]
+    return 4.0 * (BACKENDS[backend](ENGINES[engine], work) / trials)
+
+
+def build_info() -> dict:
+    """Describe the running Python, including free-threaded builds."""
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil_enabled = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    return {
+        "python": sys.version,
+        "implementation": sys.implementation.name,
+        "free_threaded": free_threaded,
+        "gil_enabled": gil_enabled,
+    }
@@ -0,0 +1,81 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+from . import BACKENDS, ENGINES, build_info, pi
+from .seeded import chunk_size_for
+
+
+def best_time(repeat: int, **kwargs) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pi(**kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m pibench",
+        description="Benchmark the pi backends, and print a JSON table.",
+    )
+    parser.add_argument(
+        "--trials", type=lambda s: int(float(s)), nargs="+", default=[10**6, 10**7]
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--engine", choices=ENGINES, default="numpy")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = []
+    for trials in args.trials:
+        common = {"trials": trials, "seed": args.seed, "engine": args.engine}
+        baseline = best_time(args.repeat, backend="single", workers=1, **common)
+        chunks = -(-trials // chunk_size_for(trials))
+
+        for backend in args.backends:
+            for workers in args.workers:
+                seconds = best_time(
+                    args.repeat, backend=backend, workers=workers, **common
+                )
+                speedup = baseline / seconds
+                if workers > chunks:
+                    print(
+                        f"Warning: {workers} workers but only {chunks} chunks",
+                        file=sys.stderr,
+                    )
+                results.append(
+                    {
+                        "backend": backend,
+                        "trials": trials,
+                        "workers": workers,
+                        "chunks": chunks,
+                        "idle_workers": max(0, workers - chunks),
+                        "seconds": seconds,
+                        "throughput": trials / seconds,
+                        "speedup": speedup,
+                        "efficiency": speedup / workers,
+                    }
+                )
+                print(
+                    f"{backend:>15} {trials=:<10} {workers=:<3} {seconds:.3}s",
+                    file=sys.stderr,
+                )
+
+    output = {
+        **build_info(),
+        "cpu_count": os.cpu_count(),
+        "engine": args.engine,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .seeded import count_chunks
+
+# Each backend takes a count function and a list of chunk lists, one per
+# worker, and returns the total number of hits.
+
+
+def single(count, work) -> int:
+    return sum(count_chunks(count, chunks) for chunks in work)
+
+
+def thread(count, work) -> int:
+    q = queue.Queue()
+    workers = [
+        threading.Thread(target=lambda c: q.put(count_chunks(count, c)), args=(c,))
+        for c in work
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sum(q.get() for _ in range(q.qsize()))
+
+
+def threadexec(count, work) -> int:
+    with ThreadPoolExecutor(len(work)) as pool:
+        return sum(pool.map(count_chunks, [count] * len(work), work))
+
+
+def procexec(count, work) -> int:
+    with ProcessPoolExecutor(len(work)) as pool:
+        return sum(pool.map(count_chunks, [count] * len(work), work))
+
+
+async def count_async(count, chunks) -> int:
+    Ncirc = 0
+    for size, seed in chunks:
+        Ncirc += count(size, seed)
+        # yield to event loop after every chunk
+        await asyncio.sleep(0)
+    return Ncirc
+
+
+async def gather_async(count, work) -> int:
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(count_async(count, chunks)) for chunks in work]
+    return sum(t.result() for t in tasks)
+
+
+def asyncpi(count, work) -> int:
+    return asyncio.run(gather_async(count, work))
+
+
+async def gather_to_thread(count, work) -> int:
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(asyncio.to_thread(count_chunks, count, chunks))
+            for chunks in work
+        ]
+    return sum(t.result() for t in tasks)
+
+
+def asyncpi_thread(count, work) -> int:
+    return asyncio.run(gather_to_thread(count, work))
+
+
+BACKENDS = {
+    "single": single,
+    "thread": thread,
+    "threadexec": threadexec,
+    "procexec": procexec,
+    "asyncpi": asyncpi,
+    "asyncpi_thread": asyncpi_thread,
+}
@@ -0,0 +1,202 @@
+import asyncio
+import contextlib
+import dataclasses
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+
+import numpy as np
+
+from . import ENGINES
+
+
+@dataclasses.dataclass(frozen=True)
+class Estimate:
+    pi: float
+    stderr: float
+    trials: int
+    z: float = 1.96  # 95% confidence
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        return self.pi - self.z * self.stderr, self.pi + self.z * self.stderr
+
+
+def make_estimate(hits: int, trials: int, z: float) -> Estimate:
+    p = hits / trials
+    return Estimate(4 * p, 4 * math.sqrt(p * (1 - p) / trials), trials, z)
+
+
+class Tally:
+    """
+    Adds up batch results in the order the batches were submitted, so the
+    estimates only depend on the seed, not on which batch finishes first.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.trials = 0
+        self.waiting = {}  # Batch index -> (hits, trials), finished early
+        self.next = 0
+
+    def add(self, index: int, trials: int, hits: int):
+        self.waiting[index] = hits, trials
+
+    def ready(self):
+        """Add up the next batches in order, yielding the totals after each."""
+        while self.next in self.waiting:
+            hits, trials = self.waiting.pop(self.next)
+            self.hits += hits
+            self.trials += trials
+            self.next += 1
+            yield self.hits, self.trials
+
+
+def count_batch(
+    count, trials: int, seed: np.random.SeedSequence, step: int, stop=None
+) -> int | None:
+    """
+    Count hits in sub-batches of ``step`` trials, each with its own spawned
+    stream. Returns None early if the ``stop`` event is set in between.
+    """
+    hits = 0
+    sizes = [min(step, trials - start) for start in range(0, trials, step)]
+    for size, child in zip(sizes, seed.spawn(len(sizes))):
+        if stop is not None and stop.is_set():
+            return None
+        hits += count(size, child)
+    return hits
+
+
+def finished(estimate: Estimate, tolerance: float, min_trials: int, max_trials: int):
+    # With few trials, p can be 0 or 1, and then the standard error is 0 too
+    if estimate.trials >= max_trials:
+        return True
+    return estimate.trials >= min_trials and estimate.stderr <= tolerance
+
+
+def progressive_pi(
+    tolerance: float,
+    *,
+    batch_size: int = 1_000_000,
+    min_trials: int = 10_000,
+    max_trials: int = 10**10,
+    workers: int | None = None,
+    seed: int | None = None,
+    engine: str = "numpy",
+    step: int = 100_000,
+    executor=ProcessPoolExecutor,
+    z: float = 1.96,
+):
+    """
+    Yield a running Estimate each time a batch of trials is added, in the
+    order they were submitted, until the standard error is at most
+    ``tolerance`` after at least ``min_trials`` (or ``max_trials`` is
+    reached). Two batches per worker are kept in flight. Once it is done,
+    queued batches are cancelled, and running ones see an event that they
+    check every ``step`` trials, and stop early.
+    """
+    count = ENGINES[engine]
+    workers = workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed)
+    tally = Tally()
+    submitted = batches = 0
+
+    with contextlib.ExitStack() as stack:
+        pool = stack.enter_context(executor(workers))
+        if isinstance(pool, ThreadPoolExecutor):
+            stop = threading.Event()
+        else:
+            # Other processes need a shared event, served by a manager
+            stop = stack.enter_context(multiprocessing.Manager()).Event()
+
+        pending = {}  # Future -> (batch index, number of trials)
+        try:
+            while True:
+                while len(pending) < 2 * workers and submitted < max_trials:
+                    size = min(batch_size, max_trials - submitted)
+                    (child,) = seeds.spawn(1)
+                    future = pool.submit(count_batch, count, size, child, step, stop)
+                    pending[future] = batches, size
+                    submitted += size
+                    batches += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tally.add(*pending.pop(future), future.result())
+
+                for hits, trials in tally.ready():
+                    estimate = make_estimate(hits, trials, z)
+                    yield estimate
+                    if finished(estimate, tolerance, min_trials, max_trials):
+                        return
+        finally:
+            # Stop running batches before the manager (if any) shuts down
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def progressive_pi_async(
+    tolerance: float,
+    *,
+    batch_size: int = 1_000_000,
+    min_trials: int = 10_000,
+    max_trials: int = 10**10,
+    workers: int | None = None,
+    seed: int | None = None,
+    engine: str = "numpy",
+    step: int = 100_000,
+    z: float = 1.96,
+):
+    """
+    Like ``progressive_pi``, but as an async generator running batches with
+    ``asyncio.to_thread``. Cancelling a task can't stop its thread, so at
+    the end an event is set that running batches check every ``step``
+    trials, and they return early instead of finishing.
+    """
+    count = ENGINES[engine]
+    workers = workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed)
+    tally = Tally()
+    submitted = batches = 0
+
+    stop = threading.Event()
+    pending = {}  # Task -> (batch index, number of trials)
+    try:
+        while True:
+            while len(pending) < 2 * workers and submitted < max_trials:
+                size = min(batch_size, max_trials - submitted)
+                (child,) = seeds.spawn(1)
+                task = asyncio.create_task(
+                    asyncio.to_thread(count_batch, count, size, child, step, stop)
+                )
+                pending[task] = batches, size
+                submitted += size
+                batches += 1
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                tally.add(*pending.pop(task), task.result())
+
+            for hits, trials in tally.ready():
+                estimate = make_estimate(hits, trials, z)
+                yield estimate
+                if finished(estimate, tolerance, min_trials, max_trials):
+                    return
+    finally:
+        stop.set()
+        for task in pending:
+            task.cancel()
+
+
+if __name__ == "__main__":
+    for estimate in progressive_pi(2e-4, seed=0):
+        low, high = estimate.interval
+        print(f"{estimate.pi:.6f} ({low:.6f}, {high:.6f}) after {estimate.trials:,}")
@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+
+CHUNK_SIZE = 1_000_000  # Largest chunk
+MIN_CHUNKS = 64  # Smaller runs get smaller chunks, to keep this many workers busy
+
+
+def chunk_size_for(trials: int) -> int:
+    return max(1, min(CHUNK_SIZE, -(-trials // MIN_CHUNKS)))
+
+
+def make_chunks(trials: int, seed: int | None, chunk_size: int | None = None):
+    """
+    Split the trials into fixed-size chunks, each with its own independent
+    random stream from ``SeedSequence.spawn``. The chunks don't depend on the
+    number of workers, so any worker count gives the same answer for a seed.
+    By default, the chunk size only depends on the number of trials.
+    """
+    if chunk_size is None:
+        chunk_size = chunk_size_for(trials)
+    sizes = [min(chunk_size, trials - start) for start in range(0, trials, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    return list(zip(sizes, seeds))
+
+
+def python_random(seed: np.random.SeedSequence) -> random.Random:
+    return random.Random(int.from_bytes(seed.generate_state(4).tobytes()))
+
+
+def count_python(trials: int, seed: np.random.SeedSequence) -> int:
+    Ncirc = 0
+    rand = python_random(seed)
+
+    for _ in range(trials):
+        x = rand.uniform(-1, 1)
+        y = rand.uniform(-1, 1)
+
+        if x * x + y * y <= 1:
+            Ncirc += 1
+
+    return Ncirc
+
+
+def count_numpy(
+    trials: int, seed: np.random.SeedSequence, batch_size: int = 100_000
+) -> int:
+    Ncirc = 0
+    rng = np.random.default_rng(seed)
+
+    buffer = np.empty(2 * batch_size)
+    for start in range(0, trials, batch_size):
+        n = min(batch_size, trials - start)
+        xy = buffer[: 2 * n]
+        rng.random(out=xy)
+        np.square(xy, out=xy)
+        Ncirc += int(np.count_nonzero(xy[:n] + xy[n:] <= 1))
+
+    return Ncirc
+
+
+def count_chunks(count, chunks) -> int:
+    return sum(count(size, seed) for size, seed in chunks)